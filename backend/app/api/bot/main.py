@@ -1,10 +1,16 @@
+import time
+from functools import cache
+
 from aiogram.types import BotCommand
 from app.core.settings import get_settings, Settings
 from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
+from aiogram.client.session.middlewares.base import BaseRequestMiddleware
 from aiogram.client.telegram import TelegramAPIServer
 from aiogram.enums import ParseMode
 
+from app.core.metrics import TELEGRAM_REQUEST_SECONDS
+
 settings: Settings = get_settings()
 
 
@@ -22,19 +28,50 @@ async def set_default_commands(bot: Bot):
 dp = Dispatcher()
 
 
-async def get_bot() -> Bot:
+class TelegramMetricsMiddleware(BaseRequestMiddleware):
+    """Time every Bot API call made through the bot's session."""
+
+    async def __call__(self, make_request, bot, method):
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            response = await make_request(bot, method)
+            outcome = "ok"
+            return response
+        finally:
+            TELEGRAM_REQUEST_SECONDS.labels(method.__api_method__, outcome).observe(
+                time.perf_counter() - started
+            )
+
+
+@cache
+def _build_bot() -> Bot:
+    bot = _create_bot()
+    bot.session.middleware(TelegramMetricsMiddleware())
+    return bot
+
+
+def _create_bot() -> Bot:
     if settings.DEBUG:
         print("Running in DEBUG mode. Bot token is:", settings.BOT_TOKEN)
-        bot = Bot(
+        return Bot(
             token=settings.BOT_TOKEN,
             default=DefaultBotProperties(parse_mode=ParseMode.MARKDOWN),
         )
-    else:
-        local_server = TelegramAPIServer.from_base("http://localhost:8081")
-        bot = Bot(
-            token=settings.BOT_TOKEN,
-            default=DefaultBotProperties(parse_mode=ParseMode.MARKDOWN),
-            server=local_server,
-        )
-    await set_default_commands(bot)
-    return bot
+    local_server = TelegramAPIServer.from_base("http://localhost:8081")
+    return Bot(
+        token=settings.BOT_TOKEN,
+        default=DefaultBotProperties(parse_mode=ParseMode.MARKDOWN),
+        server=local_server,
+    )
+
+
+async def get_bot() -> Bot:
+    """Return the process-wide bot; its HTTP session is reused across calls."""
+    return _build_bot()
+
+
+async def close_bot() -> None:
+    if _build_bot.cache_info().currsize:
+        await _build_bot().session.close()
+        _build_bot.cache_clear()
@@ -0,0 +1,20 @@
+from aiogram import Bot
+from aiogram.types import FSInputFile, Message
+
+
+async def send_media(
+    bot: Bot, /, *, chat_id: int, media_path: str, media_type: str, caption: str
+) -> int:
+    """Upload a local file to ``chat_id`` and return the Telegram message id."""
+    file = FSInputFile(media_path, filename=caption)
+    if media_type == "video":
+        res: Message = await bot.send_video(
+            chat_id=chat_id, video=file, caption=caption
+        )
+    elif media_type == "music":
+        res: Message = await bot.send_audio(
+            chat_id=chat_id, audio=file, caption=caption
+        )
+    else:
+        res: Message = await bot.send_document(chat_id=chat_id, document=file)
+    return res.message_id
@@ -1,5 +1,3 @@
-from typing import Sequence
-
 from fastapi import Depends, HTTPException, status
 
 from app.api.models import User, Channel
@@ -26,7 +24,7 @@ class ChannelController:
             )
 
     async def list(self, /, *, params: QueryParamsSchema) -> ChannelListResponseSchema:
-        channels: Sequence[Channel] = await self.__channel_repo.list(params)
+        channels, total, next_cursor = await self.__channel_repo.list(params)
         if channels:
             return ChannelListResponseSchema(
                 page=params.page,
@@ -34,7 +32,8 @@ class ChannelController:
                 search=params.search,
                 sort=params.sort,
                 filter=params.filter,
-                total=len(channels),
+                total=total,
+                next_cursor=next_cursor,
                 items=[
                     ChannelResponseSchema.model_validate(channel)
                     for channel in channels
@@ -1,10 +1,13 @@
 import os
 
 from fastapi import Depends, HTTPException, status
-from aiogram.types import FSInputFile, Message
 
 from app.api.bot.main import get_bot
-from app.api.repositories import EntertainmentRepository, EntertainmentTypeRepository
+from app.api.repositories import (
+    EntertainmentRepository,
+    EntertainmentTypeRepository,
+    UploadJobRepository,
+)
 
 from app.core.settings import get_settings, Settings
 from app.api.schemas import (
@@ -13,7 +16,9 @@ from app.api.schemas import (
     EntertainmentResponseSchema,
     EntertainmentCreateSchema,
     EntertainmentUpdate,
+    EntertainmentJobResponseSchema,
 )
+from app.api.utils.serialization import SerializedResponse, serialized
 
 
 class EntertainmentController:
@@ -21,31 +26,34 @@ class EntertainmentController:
         self,
         entertainment_repo: EntertainmentRepository = Depends(),
         entertainment_type_repo: EntertainmentTypeRepository = Depends(),
+        upload_job_repo: UploadJobRepository = Depends(),
     ):
         self.__entertainment_repo = entertainment_repo
         self.__entertainment_type_repo = entertainment_type_repo
+        self.__upload_job_repo = upload_job_repo
         self.__settings: Settings = get_settings()
 
-    async def list_(
-        self, query: EntertainmentQuerySchema
-    ) -> EntertainmentListResponseSchema:
-        entertainments = await self.__entertainment_repo.list_(query)
+    async def list_(self, query: EntertainmentQuerySchema) -> SerializedResponse:
+        entertainments, total, next_cursor = await self.__entertainment_repo.list_(
+            query
+        )
         if not entertainments:
             raise HTTPException(
                 status_code=status.HTTP_200_OK,
                 detail="Not entertainments yet",
             )
-        return EntertainmentListResponseSchema(
-            page=query.page,
-            size=query.size,
-            search=query.search,
-            filter=query.filter,
-            sort=query.sort,
-            total=len(entertainments),
-            items=[
-                EntertainmentResponseSchema.model_validate(entertainment)
-                for entertainment in entertainments
-            ],
+        return serialized(
+            EntertainmentListResponseSchema,
+            dict(
+                page=query.page,
+                size=query.size,
+                search=query.search,
+                filter=query.filter,
+                sort=query.sort,
+                total=total,
+                next_cursor=next_cursor,
+                items=entertainments,
+            ),
         )
 
     async def get(self, entertainment_id: int) -> EntertainmentResponseSchema:
@@ -77,66 +85,6 @@ class EntertainmentController:
                     detail="Entertainment type not found",
                 )
 
-    async def _upload_to_telegram(
-        self, /, *, media_path: str, media_type: str, caption: str
-    ) -> int | None:
-        bot = await get_bot()
-        msg_id = None
-        if media_type == "docs":
-            try:
-                file = FSInputFile(media_path, filename=caption)
-                res: Message = await bot.send_document(
-                    chat_id=self.__settings.TG_CHANNEL_ID, document=file
-                )
-                msg_id = res.message_id
-            except Exception as e:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"Failed to upload to Telegram: {str(e)}",
-                )
-        elif media_type == "video":
-            try:
-                file = FSInputFile(media_path, filename=caption)
-                res: Message = await bot.send_video(
-                    chat_id=self.__settings.TG_CHANNEL_ID, video=file, caption=caption
-                )
-                msg_id = res.message_id
-            except Exception as e:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"Failed to upload to Telegram: {str(e)}",
-                )
-        elif media_type == "music":
-            try:
-                file = FSInputFile(media_path, filename=caption)
-                res: Message = await bot.send_audio(
-                    chat_id=self.__settings.TG_CHANNEL_ID, audio=file, caption=caption
-                )
-                msg_id = res.message_id
-            except Exception as e:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"Failed to upload to Telegram: {str(e)}",
-                )
-        else:
-            try:
-                file = FSInputFile(media_path, filename=caption)
-                res: Message = await bot.send_document(
-                    chat_id=self.__settings.TG_CHANNEL_ID,
-                    document=file,
-                )
-                msg_id = res.message_id
-            except Exception as e:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"Failed to upload to Telegram: {str(e)}",
-                )
-        try:
-            os.remove(media_path)
-        except Exception as e:
-            pass
-        return msg_id
-
     async def _delete_from_telegram(self, message_id: int) -> None:
         bot = await get_bot()
         try:
@@ -151,22 +99,29 @@ class EntertainmentController:
 
     async def post(
         self, /, *, payload: EntertainmentCreateSchema
-    ) -> EntertainmentResponseSchema:
+    ) -> EntertainmentJobResponseSchema:
         if payload.type_id is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Type ID cannot be empty.",
             )
         await self._validate_entertainment_type(payload.type_id)
-        message_id = await self._upload_to_telegram(
-            media_path=payload.media_path,
-            media_type=payload.media_type,
-            caption=payload.title,
-        )
-        entertainment = await self.__entertainment_repo.post(
-            payload, message_id=message_id
-        )
-        return EntertainmentResponseSchema.model_validate(entertainment)
+        if not os.path.exists(payload.media_path):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Media file not found. Upload it first.",
+            )
+        job = await self.__upload_job_repo.enqueue(payload)
+        return EntertainmentJobResponseSchema.model_validate(job)
+
+    async def get_job(self, job_id: str) -> EntertainmentJobResponseSchema:
+        job = await self.__upload_job_repo.get(job_id)
+        if not job:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Upload job not found",
+            )
+        return EntertainmentJobResponseSchema.model_validate(job)
 
     async def put(
         self, entertainment_id: int, payload: EntertainmentUpdate
@@ -1,4 +1,3 @@
-from typing import Sequence
 from fastapi import Depends, HTTPException, status
 
 from app.api.models import Level
@@ -10,23 +9,28 @@ from app.api.schemas import (
     LevelUpdateSchema,
     LevelQueryParamsSchema,
 )
+from app.api.utils.serialization import SerializedResponse, serialized
 
 
 class LevelController:
     def __init__(self, level_repository: LevelRepository = Depends()):
         self.__level_repository: LevelRepository = level_repository
 
-    async def list_(self, query: LevelQueryParamsSchema) -> LevelListResponseSchema:
-        levels: Sequence[Level] = await self.__level_repository.list_(query=query)
+    async def list_(self, query: LevelQueryParamsSchema) -> SerializedResponse:
+        levels, total, next_cursor = await self.__level_repository.list_(query=query)
         if levels:
-            return LevelListResponseSchema(
-                page=query.page,
-                size=query.size,
-                search=query.search,
-                sort=query.sort,
-                filter=query.filter,
-                total=len(levels),
-                items=[LevelResponseSchema.model_validate(level) for level in levels],
+            return serialized(
+                LevelListResponseSchema,
+                dict(
+                    page=query.page,
+                    size=query.size,
+                    search=query.search,
+                    sort=query.sort,
+                    filter=query.filter,
+                    total=total,
+                    next_cursor=next_cursor,
+                    items=levels,
+                ),
             )
         raise HTTPException(
             status_code=status.HTTP_200_OK,
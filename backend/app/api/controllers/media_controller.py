@@ -1,50 +1,127 @@
+import hashlib
 import os
+import uuid
 from pathlib import Path
-from datetime import datetime, UTC
 
+import aiofiles
+import aiofiles.os
+
+from app.api.models import MediaObject
+from app.api.repositories import MediaRepository
 from app.api.schemas import MediaSchemaResponse
 from app.core.settings import Settings, get_settings
-from fastapi import UploadFile, HTTPException, status
+from fastapi import Depends, UploadFile, HTTPException, status
 
 
 class MediaController:
-    def __init__(self):
+    def __init__(self, media_repository: MediaRepository = Depends()):
         self.settings: Settings = get_settings()
         self.base_media_dir: Path = self.settings.get_base_media_dir
         self.base_static_dir: Path = self.settings.get_base_static_dir
+        self.__media_repository = media_repository
         self.make_directories()
 
     def make_directories(self) -> None:
         os.makedirs(self.base_media_dir, exist_ok=True)
         os.makedirs(self.base_static_dir, exist_ok=True)
 
+    async def write(
+        self, directory: Path, file_content: UploadFile
+    ) -> tuple[Path, str, int]:
+        """Stream ``file_content`` to a temporary file inside ``directory``.
+
+        Returns the temporary path together with the SHA-256 and size of the
+        content; the caller renames it into place, so readers never see a
+        partial file.
+        """
+        chunk_size = 1 << 20  # 1 MB
+        max_size = self.settings.MEDIA_MAX_UPLOAD_SIZE
+        tmp_path = directory / f".{uuid.uuid4().hex}.tmp"
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            async with aiofiles.open(tmp_path, "wb") as f:
+                while True:
+                    chunk = await file_content.read(chunk_size)
+                    if not chunk:
+                        break
+                    size += len(chunk)
+                    if size > max_size:
+                        raise HTTPException(
+                            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                            detail=f"File exceeds the {max_size} byte upload limit",
+                        )
+                    digest.update(chunk)
+                    await f.write(chunk)
+        except BaseException:
+            await self._discard(tmp_path)
+            raise
+        return tmp_path, digest.hexdigest(), size
+
     @staticmethod
-    async def write(file_path: Path, file_content: UploadFile) -> None:
-        chunk_size = 2 << 20  # 1 MB
-        with open(file_path, "wb") as f:
-            while True:
-                chunk = await file_content.read(chunk_size)
-                if not chunk:
-                    break
-                f.write(chunk)  # noqa
+    async def _discard(path: Path) -> None:
+        try:
+            await aiofiles.os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def content_path(root: Path, sha256: str, extension: str) -> Path:
+        """``<root>/ab/cd/abcd....<ext>``: two levels keep directories small."""
+        return root / sha256[:2] / sha256[2:4] / f"{sha256}.{extension}"
+
+    def _response(self, media: MediaObject) -> MediaSchemaResponse:
+        return MediaSchemaResponse(
+            media_url=self.settings.BASE_URL + media.path,
+            media_path=media.path,
+            sha256=media.sha256,
+        )
 
     async def upload(
-        self, media: UploadFile, *, static: bool = False
+        self, media: UploadFile, *, static: bool = False, sha256: str | None = None
     ) -> MediaSchemaResponse:
+        """Store ``media`` under its content hash.
+
+        When the client already knows the hash and the content is stored, the
+        existing file is referenced again instead of hashing and writing the
+        upload, which the server has received in full by then anyway.
+        """
+        if sha256:
+            existing = await self.__media_repository.acquire_existing(
+                sha256.lower(), static
+            )
+            if existing:
+                if await aiofiles.os.path.exists(existing.path):
+                    return self._response(existing)
+                # A row without its file, e.g. after a failed rename: drop the
+                # reference and store the upload, which puts the file back.
+                await self.__media_repository.release(existing.path)
+
+        root = self.base_static_dir if static else self.base_media_dir
         file_extension = media.filename.split(".")[-1].lower()
-        media.filename = f"{datetime.now(UTC)}.{file_extension}"
-        if static:
-            file_path = self.base_static_dir / media.filename
-        else:
-            file_path = self.base_media_dir / media.filename
-        await self.write(file_path, media)
-        return MediaSchemaResponse(
-            media_url=self.settings.BASE_URL + str(file_path),
-            media_path=str(file_path),
-        )
+        tmp_path, digest, size = await self.write(root, media)
+        try:
+            file_path = self.content_path(root, digest, file_extension)
+            stored = await self.__media_repository.acquire(
+                digest, static, str(file_path), size
+            )
+            target = Path(stored.path)
+            if await aiofiles.os.path.exists(target):
+                await self._discard(tmp_path)
+            else:
+                await aiofiles.os.makedirs(target.parent, exist_ok=True)
+                await aiofiles.os.replace(tmp_path, target)
+        except BaseException:
+            await self._discard(tmp_path)
+            raise
+        return self._response(stored)
 
-    @staticmethod
-    def clear(path: Path | str) -> None:
+    async def clear(self, path: Path | str) -> None:
+        """Release one reference to ``path``, deleting the file with the last one."""
+        if await self.__media_repository.release(str(path)):
+            return None
+        # Files saved before the content-addressed store are not reference
+        # counted and are removed right away.
         if isinstance(path, str):
             if os.path.exists(path):
                 try:
@@ -8,6 +8,7 @@ from app.api.schemas import (
     OptionUpdateSchema,
     OptionListResponseSchema,
 )
+from app.api.utils.serialization import SerializedResponse, serialized
 
 
 class OptionController:
@@ -21,7 +22,7 @@ class OptionController:
 
     async def list_(
         self, query: QueryParamsSchema, question_id: int | None = None
-    ) -> OptionListResponseSchema:
+    ) -> SerializedResponse:
         if question_id is not None:
             question = await self.__question_repository.get(question_id)
             if not question:
@@ -29,20 +30,26 @@ class OptionController:
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"Question with id {question_id} not found",
                 )
-        options = await self.__option_repository.list_(query, question_id)
+        options, total, next_cursor = await self.__option_repository.list_(
+            query, question_id
+        )
         if not options:
             raise HTTPException(
                 status_code=status.HTTP_200_OK,
                 detail="No options found",
             )
-        return OptionListResponseSchema(
-            page=query.page,
-            size=query.size,
-            search=query.search,
-            filter=query.filter,
-            sort=query.sort,
-            total=len(options),
-            items=[OptionResponseSchema.model_validate(option) for option in options],
+        return serialized(
+            OptionListResponseSchema,
+            dict(
+                page=query.page,
+                size=query.size,
+                search=query.search,
+                filter=query.filter,
+                sort=query.sort,
+                total=total,
+                next_cursor=next_cursor,
+                items=options,
+            ),
         )
 
     async def get(self, option_id: int) -> OptionResponseSchema:
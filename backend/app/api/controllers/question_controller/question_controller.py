@@ -1,9 +1,7 @@
-from typing import Sequence
-
 from fastapi import Depends, HTTPException, status
 
 from app.api.models import Question
-from app.api.repositories import QuestionRepository, OptionRepository, LevelRepository
+from app.api.repositories import QuestionRepository, QuestionPoolRepository
 from app.api.schemas import (
     QuestionListResponseSchema,
     QuestionQueryParamSchema,
@@ -12,25 +10,28 @@ from app.api.schemas import (
     QuestionUpdateSchema,
 )
 from app.api.schemas.question_schema import OptionResponseSchema
+from app.api.utils.conditional import ConditionalRequest, rows_etag
+from app.api.utils.level_catalog import LevelCatalog, get_level_catalog
+from app.api.utils.serialization import SerializedResponse, serialized
 
 
 class QuestionController:
     def __init__(
         self,
         question_repository: QuestionRepository = Depends(),
-        option_repository: OptionRepository = Depends(),
-        level_repository: LevelRepository = Depends(),
+        question_pool_repository: QuestionPoolRepository = Depends(),
+        level_catalog: LevelCatalog = Depends(get_level_catalog),
     ):
         self.__question_repository = question_repository
-        self.__option_repository = option_repository
-        self.__level_repository = level_repository
+        self.__question_pool_repository = question_pool_repository
+        self.__level_catalog = level_catalog
 
     async def _validate_level_and_theme(
         self, level_id: int, theme_id: int, update: bool = False
     ) -> None:
         if update:
             if level_id:
-                level = await self.__level_repository.get(level_id)
+                level = await self.__level_catalog.get(level_id)
                 if not level:
                     raise HTTPException(
                         status_code=status.HTTP_404_NOT_FOUND,
@@ -42,7 +43,7 @@ class QuestionController:
                         detail=f"It is not level id {level_id} for questions.",
                     )
             if theme_id:
-                theme = await self.__level_repository.get(theme_id)
+                theme = await self.__level_catalog.get(theme_id)
                 if not theme:
                     raise HTTPException(
                         status_code=status.HTTP_404_NOT_FOUND,
@@ -54,8 +55,8 @@ class QuestionController:
                         detail=f"It is not theme id {theme_id} for questions.",
                     )
             return
-        level = await self.__level_repository.get(level_id)
-        theme = await self.__level_repository.get(theme_id)
+        level = await self.__level_catalog.get(level_id)
+        theme = await self.__level_catalog.get(theme_id)
         if not level:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -77,63 +78,75 @@ class QuestionController:
                 detail=f"It is not theme id {theme_id} for questions.",
             )
 
-    async def _response_to_list(
-        self, questions: Sequence[Question], query: QuestionQueryParamSchema
-    ) -> QuestionListResponseSchema:
-        return QuestionListResponseSchema(
-            page=query.page,
-            size=query.size,
-            search=query.search,
-            filter=query.filter,
-            sort=query.sort,
-            total=len(questions),
-            items=[
-                QuestionResponseSchema(
-                    id=question.id,
-                    name=question.name,
-                    picture=question.picture,
-                    answer=question.answer,
-                    type=question.type,
-                    level_id=question.level_id,
-                    theme_id=question.theme_id,
-                    created_at=question.created_at,
-                    updated_at=question.updated_at,
-                    variants=[
-                        OptionResponseSchema.model_validate(option)
-                        for option in await self.__option_repository.get_question_options(
-                            question.id
-                        )
-                    ],
-                )
-                for question in questions
+    @staticmethod
+    def _response_to_question(question: Question) -> QuestionResponseSchema:
+        return QuestionResponseSchema(
+            id=question.id,
+            name=question.name,
+            picture=question.picture,
+            answer=question.answer,
+            type=question.type,
+            level_id=question.level_id,
+            theme_id=question.theme_id,
+            created_at=question.created_at,
+            updated_at=question.updated_at,
+            variants=[
+                OptionResponseSchema.model_validate(option)
+                for option in question.options
             ],
         )
 
     async def list_(
         self,
         query: QuestionQueryParamSchema,
-    ) -> QuestionListResponseSchema:
+        conditional: ConditionalRequest | None = None,
+    ) -> SerializedResponse:
         if query.level_id is not None:
-            level = await self.__level_repository.get(query.level_id)
+            level = await self.__level_catalog.get(query.level_id)
             if not level:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"Level with ID {query.level_id} not found.",
                 )
         if query.theme_id is not None:
-            theme = await self.__level_repository.get(query.theme_id)
+            theme = await self.__level_catalog.get(query.theme_id)
             if not theme:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"Theme with ID {query.theme_id} not found.",
                 )
-        questions = await self.__question_repository.list_(query=query)
+        questions, total, next_cursor = await self.__question_repository.list_(
+            query=query
+        )
         if not questions:
             raise HTTPException(
                 status_code=status.HTTP_200_OK,
                 detail="No questions found.",
             )
-        return await self._response_to_list(questions, query)
+        headers = None
+        if conditional is not None:
+            headers = conditional.evaluate(
+                rows_etag(
+                    questions,
+                    *(rows_etag(question.options) for question in questions),
+                    total,
+                    next_cursor,
+                )
+            )
+        return serialized(
+            QuestionListResponseSchema,
+            dict(
+                page=query.page,
+                size=query.size,
+                search=query.search,
+                filter=query.filter,
+                sort=query.sort,
+                total=total,
+                next_cursor=next_cursor,
+                items=questions,
+            ),
+            headers=headers,
+        )
 
     async def get(self, question_id: int) -> QuestionResponseSchema:
         question = await self.__question_repository.get(question_id)
@@ -142,40 +155,7 @@ class QuestionController:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Question with ID {question_id} not found.",
             )
-        options = await self.__option_repository.get_question_options(question_id)
-        return QuestionResponseSchema(
-            id=question.id,
-            name=question.name,
-            picture=question.picture,
-            answer=question.answer,
-            type=question.type,
-            level_id=question.level_id,
-            theme_id=question.theme_id,
-            created_at=question.created_at,
-            updated_at=question.updated_at,
-            variants=[
-                OptionResponseSchema.model_validate(option) for option in options
-            ],
-        )
-
-    async def _response_to_question(self, question: Question) -> QuestionResponseSchema:
-        return QuestionResponseSchema(
-            id=question.id,
-            name=question.name,
-            picture=question.picture,
-            answer=question.answer,
-            type=question.type,
-            level_id=question.level_id,
-            theme_id=question.theme_id,
-            created_at=question.created_at,
-            updated_at=question.updated_at,
-            variants=[
-                OptionResponseSchema.model_validate(option)
-                for option in await self.__option_repository.get_question_options(
-                    question.id
-                )
-            ],
-        )
+        return self._response_to_question(question)
 
     async def post(self, payload: QuestionCreateSchema) -> QuestionResponseSchema:
         if not payload.level_id or not payload.theme_id:
@@ -185,7 +165,8 @@ class QuestionController:
             )
         await self._validate_level_and_theme(payload.level_id, payload.theme_id)
         question = await self.__question_repository.post(payload)
-        return await self._response_to_question(question)
+        await self.__question_pool_repository.add(question)
+        return self._response_to_question(question)
 
     async def put(
         self, question_id: int, payload: QuestionUpdateSchema
@@ -199,26 +180,43 @@ class QuestionController:
         await self._validate_level_and_theme(
             payload.level_id, payload.theme_id, update=True
         )
+        previous_bucket = (question.level_id, question.theme_id, question.type)
         updated_question = await self.__question_repository.put(question_id, payload)
-        return await self._response_to_question(updated_question)
+        if previous_bucket != (
+            updated_question.level_id,
+            updated_question.theme_id,
+            updated_question.type,
+        ):
+            await self.__question_pool_repository.move(
+                updated_question, *previous_bucket
+            )
+        return self._response_to_question(updated_question)
 
     async def delete(self, question_id: int) -> None:
-        question = await self.__question_repository.get(question_id)
-        if not question:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Question with ID {question_id} not found.",
-            )
-        await self.__question_repository.delete(question_id)
+        question = await self.__question_repository.delete(question_id)
+        await self.__question_pool_repository.remove(question)
         return None
 
     async def random(
         self, level_id: int, theme_id: int, limit
     ) -> list[QuestionResponseSchema]:
         await self._validate_level_and_theme(level_id, theme_id)
-        questions = await self.__question_repository.random(level_id, theme_id, limit)
+        question_ids = await self.__question_pool_repository.sample(
+            level_id, theme_id, limit
+        )
+        if question_ids is None:
+            questions = await self.__question_repository.random(
+                level_id, theme_id, limit
+            )
+        else:
+            by_id = {
+                question.id: question
+                for question in await self.__question_repository.get_many(question_ids)
+            }
+            # Keep the random draw order; ids deleted since the pool was built drop out.
+            questions = [by_id[i] for i in question_ids if i in by_id]
         return (
-            [await self._response_to_question(question) for question in questions]
+            [self._response_to_question(question) for question in questions]
             if questions
             else []
         )
@@ -1,7 +1,7 @@
 from fastapi import Depends, status, HTTPException
 from datetime import date
 
-from app.api.models import User
+from app.api.models import User, Option
 from app.api.repositories import (
     UserAnswerRepository,
     QuestionRepository,
@@ -13,7 +13,11 @@ from app.api.schemas import (
     UserAnswerListResponseSchema,
     UserAnswerResponseSchema,
     UserAnswerCreateSchema,
+    UserAnswerBatchCreateSchema,
+    UserAnswerBatchResponseSchema,
+    UserAnswerResultSchema,
 )
+from app.api.utils.serialization import SerializedResponse, serialized
 
 
 class UserAnswerController:
@@ -29,9 +33,7 @@ class UserAnswerController:
         self.__question_repository: QuestionRepository = question_repository
         self.__option_repository: OptionRepository = option_repository
 
-    async def list_(
-        self, query: UserAnswerQuery, user_id: int
-    ) -> UserAnswerListResponseSchema:
+    async def list_(self, query: UserAnswerQuery, user_id: int) -> SerializedResponse:
         user: User | None = await self.__user_repository.get_by_id(user_id)
         if user is None:
             raise HTTPException(
@@ -42,7 +44,7 @@ class UserAnswerController:
             query.start_date = date.today()
         if query.end_date is None:
             query.end_date = user.get_created_time
-        user_answers = await self.__user_answer_repository.list_(
+        user_answers, total, next_cursor = await self.__user_answer_repository.list_(
             query=query, user_id=user_id
         )
         if not user_answers:
@@ -51,42 +53,30 @@ class UserAnswerController:
                 detail="No user answers found for the given query.",
             )
 
-        correct_answers = await self.get_correct_answers(
-            user_id, start_date=query.start_date, end_date=query.end_date
-        )
-        total_questions = await self.__user_answer_repository.get_total_questions(
-            user_id
-        )
-        return UserAnswerListResponseSchema(
-            page=query.page,
-            size=query.size,
-            total=len(user_answers),
-            start_date=query.start_date,
-            end_date=query.end_date,
-            correct_answers=correct_answers,
-            total_questions=total_questions,
-            accuracy=(correct_answers / total_questions) * 100,
-            user_answers=[
-                UserAnswerResponseSchema.model_validate(user_answer)
-                for user_answer in user_answers
-            ],
+        correct_answers, total_questions = (
+            await self.__user_answer_repository.get_answer_stats(
+                user_id, start_date=query.start_date, end_date=query.end_date
+            )
         )
-
-    async def get_correct_answers(
-        self, user_id: int, start_date: date, end_date: date
-    ) -> int:
-        user_answers = await self.__user_answer_repository.get_correct_answers(
-            user_id, start_date, end_date
+        return serialized(
+            UserAnswerListResponseSchema,
+            dict(
+                page=query.page,
+                size=query.size,
+                total=total,
+                next_cursor=next_cursor,
+                start_date=query.start_date,
+                end_date=query.end_date,
+                correct_answers=correct_answers,
+                total_questions=total_questions,
+                accuracy=(
+                    (correct_answers / total_questions) * 100 if total_questions else 0
+                ),
+                user_answers=user_answers,
+            ),
         )
-        counter = 0
-        for user_answer in user_answers:
-            if await self.__option_repository.check_answer(
-                user_answer.question_id, user_answer.option_id
-            ):
-                counter += 1
-        return counter
 
-    async def _validate_data(self, user_answer: UserAnswerCreateSchema) -> None:
+    async def _validate_data(self, user_answer: UserAnswerCreateSchema) -> Option:
         question = await self.__question_repository.get(user_answer.question_id)
         if not question:
             raise HTTPException(
@@ -104,12 +94,57 @@ class UserAnswerController:
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Option does not belong to the specified question",
             )
+        return option
 
     async def post(
         self, payload: UserAnswerCreateSchema, user_id: int
     ) -> UserAnswerResponseSchema:
-        await self._validate_data(payload)
+        option = await self._validate_data(payload)
         user_answer = await self.__user_answer_repository.post(
-            payload=payload, user_id=user_id
+            payload=payload, user_id=user_id, is_correct=option.is_correct
         )
         return UserAnswerResponseSchema.model_validate(user_answer)
+
+    async def post_many(
+        self, payload: UserAnswerBatchCreateSchema, user_id: int
+    ) -> UserAnswerBatchResponseSchema:
+        options = {
+            option.id: option
+            for option in await self.__option_repository.get_many(
+                [answer.option_id for answer in payload.answers]
+            )
+        }
+        for answer in payload.answers:
+            option = options.get(answer.option_id)
+            if option is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Option {answer.option_id} not found",
+                )
+            if option.question_id != answer.question_id:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Option {answer.option_id} does not belong to question {answer.question_id}",
+                )
+        correct_answers = sum(
+            options[answer.option_id].is_correct for answer in payload.answers
+        )
+        user_answers = await self.__user_answer_repository.post_many(
+            payload.answers, user_id=user_id, correct=correct_answers
+        )
+        return UserAnswerBatchResponseSchema(
+            total=len(user_answers),
+            correct_answers=correct_answers,
+            score=(correct_answers / len(user_answers)) * 100,
+            items=[
+                UserAnswerResultSchema(
+                    id=user_answer.id,
+                    question_id=user_answer.question_id,
+                    option_id=user_answer.option_id,
+                    is_correct=options[user_answer.option_id].is_correct,
+                    created_at=user_answer.created_at,
+                    updated_at=user_answer.updated_at,
+                )
+                for user_answer in user_answers
+            ],
+        )
@@ -37,14 +37,15 @@ class UserController:
         return UserResponseSchema.model_validate(user)
 
     async def list(self, params: QueryParamsSchema) -> UserListResponseSchema:
-        users = await self.__user_repo.list(params=params)
+        users, total, next_cursor = await self.__user_repo.list(params=params)
         return UserListResponseSchema(
             page=params.page,
             size=params.size,
             search=params.search,
             filter=params.filter,
             sort=params.sort,
-            total=len(users),
+            total=total,
+            next_cursor=next_cursor,
             items=[UserResponseSchema.model_validate(user) for user in users],
         )
 
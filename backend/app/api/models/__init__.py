@@ -4,3 +4,5 @@ from .level import Level
 from .question import Option, Question, UserAnswer
 from .setting import Setting
 from .entertainment import Entertainment, EntertainmentTypes
+from .user_stats import UserStatsDaily
+from .media import MediaObject
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from sqlalchemy import String, BigInteger, ForeignKey
+from sqlalchemy import String, BigInteger, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime, UTC
 
@@ -8,6 +8,14 @@ from app.core.models.base import TimestampMixin
 
 class Entertainment(TimestampMixin):
     __tablename__ = "entertainments"
+    __table_args__ = (
+        Index(
+            "ix_entertainments_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+    )
 
     message_id: Mapped[int] = mapped_column(BigInteger, index=True, nullable=False)
     title: Mapped[str] = mapped_column(String(255), index=True, nullable=False)
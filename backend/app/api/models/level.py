@@ -1,5 +1,5 @@
 from __future__ import annotations
-from sqlalchemy import String
+from sqlalchemy import String, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime, UTC
 from typing import TYPE_CHECKING
@@ -12,6 +12,14 @@ from app.core.models.base import TimestampMixin
 
 class Level(TimestampMixin):
     __tablename__ = "levels"
+    __table_args__ = (
+        Index(
+            "ix_levels_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
     name: Mapped[str] = mapped_column(
         String(255), index=True, nullable=False, unique=True
     )
@@ -28,6 +36,7 @@ class Level(TimestampMixin):
         back_populates="level",
         primaryjoin="Level.id==Question.level_id",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     theme_questions: Mapped[list["Question"]] = relationship(
@@ -35,6 +44,7 @@ class Level(TimestampMixin):
         back_populates="theme",
         primaryjoin="Level.id==Question.theme_id",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     def __repr__(self):
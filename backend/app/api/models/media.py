@@ -0,0 +1,31 @@
+from __future__ import annotations
+from sqlalchemy import String, Integer, BigInteger, Boolean
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql.schema import UniqueConstraint
+
+from app.core.models.base import TimestampMixin
+
+
+class MediaObject(TimestampMixin):
+    """A stored file, addressed by the SHA-256 of its content.
+
+    ``ref_count`` counts the uploads that resolved to this file; the file is
+    removed from disk only when the last of them is cleared.
+    """
+
+    __tablename__ = "media_objects"
+    __table_args__ = (
+        UniqueConstraint("sha256", "static", name="uq_media_objects_sha256_static"),
+    )
+
+    sha256: Mapped[str] = mapped_column(String(64), nullable=False)
+    static: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    path: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
+    size: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    ref_count: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+
+    def __repr__(self):
+        return f"<MediaObject(sha256='{self.sha256}', path='{self.path}', ref_count={self.ref_count})>"
+
+    def __str__(self):
+        return self.__repr__()
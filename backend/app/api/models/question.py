@@ -1,5 +1,5 @@
 from __future__ import annotations
-from sqlalchemy import String, TEXT, Boolean, Integer, BigInteger, ForeignKey
+from sqlalchemy import String, TEXT, Boolean, Integer, BigInteger, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql.schema import UniqueConstraint
 from sqlalchemy.dialects.postgresql import JSON
@@ -15,6 +15,14 @@ from app.core.models.base import TimestampMixin
 
 class Question(TimestampMixin):
     __tablename__ = "questions"
+    __table_args__ = (
+        Index(
+            "ix_questions_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
 
     name: Mapped[str] = mapped_column(
         String(255), nullable=False, index=True, unique=True
@@ -27,10 +35,10 @@ class Question(TimestampMixin):
 
     # foreign keys
     level_id: Mapped[int] = mapped_column(
-        ForeignKey("levels.id"), nullable=False, index=True
+        ForeignKey("levels.id", ondelete="CASCADE"), nullable=False, index=True
     )
     theme_id: Mapped[int] = mapped_column(
-        ForeignKey("levels.id"), nullable=False, index=True
+        ForeignKey("levels.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
     # relationships
@@ -41,10 +49,16 @@ class Question(TimestampMixin):
         "Level", back_populates="theme_questions", foreign_keys=[theme_id]
     )
     options: Mapped[list["Option"]] = relationship(
-        "Option", back_populates="question", cascade="all, delete-orphan"
+        "Option",
+        back_populates="question",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     user_answers: Mapped[list["UserAnswer"]] = relationship(
-        "UserAnswer", back_populates="question", cascade="all, delete-orphan"
+        "UserAnswer",
+        back_populates="question",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     def __repr__(self):
@@ -66,9 +80,15 @@ class Option(TimestampMixin):
     __tablename__ = "options"
     __table_args__ = (
         UniqueConstraint("question_id", "option", name="uq_question_option"),
+        Index(
+            "ix_options_option_trgm",
+            "option",
+            postgresql_using="gin",
+            postgresql_ops={"option": "gin_trgm_ops"},
+        ),
     )
     question_id: Mapped[int] = mapped_column(
-        ForeignKey("questions.id"), nullable=False, index=True
+        ForeignKey("questions.id", ondelete="CASCADE"), nullable=False, index=True
     )
     option: Mapped[str] = mapped_column(String(255), nullable=False)
     is_correct: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
@@ -98,7 +118,7 @@ class UserAnswer(TimestampMixin):
         ForeignKey("users.id"), nullable=False, index=True
     )
     question_id: Mapped[int] = mapped_column(
-        ForeignKey("questions.id"), nullable=False, index=True
+        ForeignKey("questions.id", ondelete="CASCADE"), nullable=False, index=True
     )
     option_id: Mapped[int] = mapped_column(
         ForeignKey("options.id"), nullable=False, index=True
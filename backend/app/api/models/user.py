@@ -1,5 +1,5 @@
 from __future__ import annotations
-from sqlalchemy import String, BigInteger
+from sqlalchemy import String, BigInteger, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime, UTC, date
 from typing import TYPE_CHECKING
@@ -15,6 +15,20 @@ settings: Settings = get_settings()
 
 class User(TimestampMixin):
     __tablename__ = "users"
+    __table_args__ = (
+        Index(
+            "ix_users_first_name_trgm",
+            "first_name",
+            postgresql_using="gin",
+            postgresql_ops={"first_name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_users_last_name_trgm",
+            "last_name",
+            postgresql_using="gin",
+            postgresql_ops={"last_name": "gin_trgm_ops"},
+        ),
+    )
 
     first_name: Mapped[str] = mapped_column(String(255), nullable=False)
     last_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
@@ -0,0 +1,35 @@
+from __future__ import annotations
+from sqlalchemy import Integer, Date, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql.schema import UniqueConstraint
+from datetime import date
+
+from app.core.models.base import BaseModel
+
+
+class UserStatsDaily(BaseModel):
+    """Per-user, per-day answer counters maintained alongside ``user_answers``.
+
+    The repository adds to them when answers are saved; database triggers
+    correct them when answers are deleted (including cascades from questions
+    and levels) or an option's ``is_correct`` changes. Anything else that
+    writes ``user_answers`` directly must run ``backfill_stats.py``.
+    """
+
+    __tablename__ = "user_stats_daily"
+    __table_args__ = (
+        UniqueConstraint("user_id", "day", name="uq_user_stats_daily_user_day"),
+    )
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    day: Mapped[date] = mapped_column(Date, nullable=False)
+    answered: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    correct: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<UserStatsDaily(user_id={self.user_id}, day={self.day}, answered={self.answered}, correct={self.correct})>"
+
+    def __str__(self):
+        return self.__repr__()
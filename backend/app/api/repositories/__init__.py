@@ -4,8 +4,11 @@ from .level_repositories import LevelRepository
 from .entertainment_repository import EntertainmentRepository
 from .entertainment_type_repository import EntertainmentTypeRepository
 from .setting_repository import SettingRepository
+from .upload_job_repository import UploadJobRepository
+from .media_repository import MediaRepository
 from .question_repository import (
     OptionRepository,
     QuestionRepository,
+    QuestionPoolRepository,
     UserAnswerRepository,
 )
@@ -2,10 +2,11 @@ from fastapi import Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.future import select
-from typing import Sequence
 
 from app.api.models import Channel
 from app.api.schemas import QueryParamsSchema, CreateChannelSchema, UpdateChannelSchema
+from app.api.utils.pagination import Page, fetch_page
+from app.api.utils.search import search
 from app.core.databases.postgres import get_general_session
 
 
@@ -13,16 +14,10 @@ class ChannelRepository:
     def __init__(self, session: AsyncSession = Depends(get_general_session)) -> None:
         self.__session: AsyncSession = session
 
-    async def list(self, params: QueryParamsSchema) -> Sequence[Channel]:
-        query = select(Channel).offset(params.offset).limit(params.limit)
+    async def list(self, params: QueryParamsSchema) -> Page:
+        query = select(Channel)
         if params.search:
-            query = query.where(Channel.name.ilike(f"%{params.search}%"))
-        if params.sort:
-            sort_column = getattr(Channel, params.sort.lstrip("-"), None)
-            if sort_column:
-                query = query.order_by(
-                    sort_column.desc() if params.sort.startswith("-") else sort_column
-                )
+            query = query.where(search(params.search, (Channel.name,)))
         if params.filter:
             filter_column = getattr(Channel, params.filter.lstrip("-"), None)
             if filter_column:
@@ -31,8 +26,7 @@ class ChannelRepository:
                         True if not params.filter.startswith("-") else False
                     )
                 )
-        result = await self.__session.execute(query)
-        return result.scalars().all()
+        return await fetch_page(self.__session, query, Channel, params)
 
     async def get(self, channel_id: int) -> Channel | None:
         query = select(Channel).where(Channel.id == channel_id)
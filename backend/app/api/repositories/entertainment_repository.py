@@ -2,7 +2,6 @@ from fastapi import Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.future import select
-from typing import Sequence
 
 from app.api.models import Entertainment
 from app.api.schemas import (
@@ -10,6 +9,9 @@ from app.api.schemas import (
     EntertainmentCreateSchema,
     EntertainmentQuerySchema,
 )
+from app.api.utils.pagination import Page, fetch_page
+from app.api.utils.response_cache import get_response_cache
+from app.api.utils.search import search
 from app.core.databases.postgres import get_general_session
 
 
@@ -17,35 +19,31 @@ class EntertainmentRepository:
     def __init__(self, session: AsyncSession = Depends(get_general_session)) -> None:
         self.__session: AsyncSession = session
 
-    async def list_(self, query: EntertainmentQuerySchema) -> Sequence[Entertainment]:
+    async def list_(self, query: EntertainmentQuerySchema) -> Page:
         query_obj = select(Entertainment)
         if query.filter is not None:
             query_obj = query_obj.where(Entertainment.type_id == query.filter)
-        sort_string = query.sort
-        if sort_string:
-            if sort_string.startswith("-"):
-                sort_column = getattr(Entertainment, sort_string[1:], None)
-                if sort_column:
-                    query_obj = query_obj.order_by(sort_column.desc())
-            else:
-                sort_column = getattr(Entertainment, sort_string, None)
-                if sort_column:
-                    query_obj = query_obj.order_by(sort_column)
         if query.search:
-            query_obj = query_obj.where(Entertainment.title.ilike(f"%{query.search}%"))
-        query_obj = query_obj.offset(query.offset).limit(query.limit)
-        result = await self.__session.execute(query_obj)
-        return result.scalars().all()
+            query_obj = query_obj.where(search(query.search, (Entertainment.title,)))
+        return await fetch_page(self.__session, query_obj, Entertainment, query)
 
     async def get(self, entertainment_id: int) -> Entertainment | None:
         query = select(Entertainment).where(Entertainment.id == entertainment_id)
         result = await self.__session.execute(query)
         return result.scalar_one_or_none()
 
+    async def get_by_message_id(self, message_id: int) -> Entertainment | None:
+        query = select(Entertainment).where(Entertainment.message_id == message_id)
+        result = await self.__session.execute(query)
+        return result.scalars().first()
+
     async def _add_2_db(self, obj: Entertainment) -> None:
         self.__session.add(obj)
         try:
             await self.__session.commit()
+            await get_response_cache().invalidate(
+                "entertainments", f"entertainment:{obj.id}"
+            )
         except IntegrityError:
             await self.__session.rollback()
             raise HTTPException(
@@ -89,6 +87,9 @@ class EntertainmentRepository:
         await self.__session.delete(entertainment)
         try:
             await self.__session.commit()
+            await get_response_cache().invalidate(
+                "entertainments", f"entertainment:{entertainment_id}"
+            )
         except Exception as e:
             await self.__session.rollback()
             raise HTTPException(
@@ -7,6 +7,7 @@ from sqlalchemy.future import select
 
 from app.api.models import EntertainmentTypes
 from app.api.schemas import EntertainmentTypesSchema
+from app.api.utils.response_cache import get_response_cache
 from app.core.databases.postgres import get_general_session
 
 
@@ -30,6 +31,9 @@ class EntertainmentTypeRepository:
         self.__session.add(obj)
         try:
             await self.__session.commit()
+            await get_response_cache().invalidate(
+                "entertainment_types", f"entertainment_type:{obj.id}"
+            )
         except IntegrityError:
             await self.__session.rollback()
             raise HTTPException(
@@ -72,6 +76,13 @@ class EntertainmentTypeRepository:
         await self.__session.delete(entertainment_type)
         try:
             await self.__session.commit()
+            # Entertainments of the type are removed along with it; their
+            # single-resource entries carry the type's tag.
+            await get_response_cache().invalidate(
+                "entertainment_types",
+                f"entertainment_type:{entertainment_type_id}",
+                "entertainments",
+            )
         except Exception as e:
             await self.__session.rollback()
             raise HTTPException(
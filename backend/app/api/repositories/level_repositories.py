@@ -1,12 +1,15 @@
 from fastapi import Depends, status, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy import delete, or_
 from sqlalchemy.future import select
-from typing import Sequence
 
-from app.api.controllers.media_controller import MediaController
-from app.api.models import Level
+from app.api.models import Level, Question
 from app.api.schemas import LevelCreateSchema, LevelUpdateSchema, LevelQueryParamsSchema
+from app.api.utils.level_catalog import get_level_catalog
+from app.api.utils.pagination import Page, fetch_page
+from app.api.utils.response_cache import get_response_cache
+from app.api.utils.search import search
 from app.core.databases.postgres import get_general_session
 
 
@@ -14,8 +17,8 @@ class LevelRepository:
     def __init__(self, session: AsyncSession = Depends(get_general_session)):
         self.__session = session
 
-    async def list_(self, query: LevelQueryParamsSchema) -> Sequence[Level]:
-        query_obj = select(Level).offset(query.offset).limit(query.limit)
+    async def list_(self, query: LevelQueryParamsSchema) -> Page:
+        query_obj = select(Level)
         if not query.type and query.type not in ["section", "level", "theme"]:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -24,13 +27,7 @@ class LevelRepository:
         if query.type:
             query_obj = query_obj.where(Level.type == query.type)
         if query.search:
-            query_obj = query_obj.where(Level.name.ilike(f"%{query.search}%"))
-        if query.sort:
-            sort_column = getattr(Level, query.sort.lstrip("-"), None)
-            if sort_column:
-                query_obj = query_obj.order_by(
-                    sort_column.desc() if query.sort.startswith("-") else sort_column
-                )
+            query_obj = query_obj.where(search(query.search, (Level.name,)))
         if query.filter:
             filter_column = getattr(Level, query.filter.lstrip("-"), None)
             if filter_column:
@@ -39,8 +36,7 @@ class LevelRepository:
                         True if not query.filter.startswith("-") else False
                     )
                 )
-        result = await self.__session.execute(query_obj)
-        return result.scalars().all()
+        return await fetch_page(self.__session, query_obj, Level, query)
 
     async def get(self, level_id: int) -> Level | None:
         level = await self.__session.execute(select(Level).where(Level.id == level_id))
@@ -51,6 +47,8 @@ class LevelRepository:
         try:
             self.__session.add(level)
             await self.__session.commit()
+            await get_level_catalog().invalidate()
+            await get_response_cache().invalidate("levels")
             return level
         except IntegrityError:
             await self.__session.rollback()
@@ -75,6 +73,8 @@ class LevelRepository:
         try:
             self.__session.add(level)
             await self.__session.commit()
+            await get_level_catalog().invalidate()
+            await get_response_cache().invalidate("levels", f"level:{level_id}")
         except IntegrityError:
             await self.__session.rollback()
             raise HTTPException(
@@ -90,10 +90,25 @@ class LevelRepository:
         return level
 
     async def delete(self, level_id: int) -> None:
-        level = await self.get(level_id)
-        if not level:
+        # Questions, their options and answers go with the level through
+        # ON DELETE CASCADE, without being loaded into the session. Only the
+        # question ids are read, so their cached options can be dropped too.
+        question_ids = await self.__session.scalars(
+            select(Question.id).where(
+                or_(Question.level_id == level_id, Question.theme_id == level_id)
+            )
+        )
+        question_tags = [f"question:{question_id}" for question_id in question_ids]
+        result = await self.__session.execute(
+            delete(Level).where(Level.id == level_id).returning(Level.id)
+        )
+        if result.scalar_one_or_none() is None:
+            await self.__session.rollback()
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Level not found."
             )
-        await self.__session.delete(level)
         await self.__session.commit()
+        await get_level_catalog().invalidate()
+        await get_response_cache().invalidate(
+            "levels", f"level:{level_id}", "options", *question_tags
+        )
@@ -0,0 +1,85 @@
+import aiofiles.os
+from fastapi import Depends, HTTPException, status
+from sqlalchemy import delete, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.models import MediaObject
+from app.core.databases.postgres import get_general_session
+
+
+class MediaRepository:
+    def __init__(self, session: AsyncSession = Depends(get_general_session)):
+        self.__session = session
+
+    async def acquire_existing(self, sha256: str, static: bool) -> MediaObject | None:
+        """Add a reference to an already stored file, if there is one."""
+        result = await self.__session.execute(
+            update(MediaObject)
+            .where(MediaObject.sha256 == sha256, MediaObject.static.is_(static))
+            .values(ref_count=MediaObject.ref_count + 1)
+            .returning(MediaObject)
+        )
+        media = result.scalar_one_or_none()
+        await self.__session.commit()
+        return media
+
+    async def acquire(
+        self, sha256: str, static: bool, path: str, size: int
+    ) -> MediaObject:
+        """Register a reference to ``sha256``, creating its row on first upload.
+
+        When the content is already stored the returned row keeps its original
+        ``path``, which may differ from the one passed in.
+        """
+        stmt = insert(MediaObject).values(
+            sha256=sha256, static=static, path=path, size=size, ref_count=1
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_media_objects_sha256_static",
+            set_={"ref_count": MediaObject.ref_count + 1},
+        ).returning(MediaObject)
+        try:
+            result = await self.__session.execute(stmt)
+            media = result.scalar_one()
+            await self.__session.commit()
+        except Exception as e:
+            await self.__session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to register media file: {str(e)}",
+            )
+        return media
+
+    async def release(self, path: str) -> bool:
+        """Drop one reference to ``path`` and delete the file with the last one.
+
+        Returns ``False`` when ``path`` is not tracked (files uploaded before
+        the content-addressed store), leaving those to the caller. The file is
+        removed while the row is still locked, so a concurrent upload of the
+        same content either bumps the count first or recreates both afterwards.
+        """
+        result = await self.__session.execute(
+            update(MediaObject)
+            .where(MediaObject.path == path)
+            .values(ref_count=MediaObject.ref_count - 1)
+            .returning(MediaObject.ref_count)
+        )
+        ref_count = result.scalar_one_or_none()
+        if ref_count is None:
+            await self.__session.rollback()
+            return False
+        try:
+            if ref_count <= 0:
+                await self.__session.execute(
+                    delete(MediaObject).where(MediaObject.path == path)
+                )
+                try:
+                    await aiofiles.os.remove(path)
+                except FileNotFoundError:
+                    pass
+            await self.__session.commit()
+        except Exception:
+            await self.__session.rollback()
+            raise
+        return True
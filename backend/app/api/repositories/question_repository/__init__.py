@@ -1,9 +1,11 @@
 from .option_repository import OptionRepository
 from .question_repository import QuestionRepository
+from .question_pool_repository import QuestionPoolRepository
 from .user_answer_repository import UserAnswerRepository
 
 __all__ = (
     "OptionRepository",
     "QuestionRepository",
+    "QuestionPoolRepository",
     "UserAnswerRepository",
 )
@@ -6,6 +6,9 @@ from typing import Sequence
 
 from app.api.models import Option
 from app.api.schemas import QueryParamsSchema, OptionCreateSchema, OptionUpdateSchema
+from app.api.utils.pagination import Page, fetch_page
+from app.api.utils.response_cache import get_response_cache
+from app.api.utils.search import search
 from app.core.databases.postgres import get_general_session
 
 
@@ -13,42 +16,46 @@ class OptionRepository:
     def __init__(self, session: AsyncSession = Depends(get_general_session)):
         self.__session = session
 
-    async def list_(
-        self, query: QueryParamsSchema, question_id: int | None
-    ) -> Sequence[Option]:
+    async def list_(self, query: QueryParamsSchema, question_id: int | None) -> Page:
         query_obj = select(Option)
         if question_id is not None:
             query_obj = select(Option).where(Option.question_id == question_id)
         if query.search:
-            query_obj = query_obj.where(Option.option.ilike(f"%{query.search}%"))
-        if query.sort:
-            if query.sort.startswith("-"):
-                query_obj = query_obj.order_by(getattr(Option, query.sort[1:]).desc())
-            else:
-                query_obj = query_obj.order_by(getattr(Option, query.sort).asc())
+            query_obj = query_obj.where(search(query.search, (Option.option,)))
         if query.filter:
             if query.filter == "is_correct":
                 query_obj = query_obj.where(Option.is_correct.is_(True))
             if query.filter == "-is_correct":
                 query_obj = query_obj.where(Option.is_correct.is_(False))
-        query_obj = query_obj.offset(query.offset).limit(query.limit)
-        result = await self.__session.execute(query_obj)
-        return result.scalars().all()
+        return await fetch_page(self.__session, query_obj, Option, query)
 
     async def get(self, option_id: int) -> Option | None:
         query_obj = select(Option).where(Option.id == option_id)
         result = await self.__session.execute(query_obj)
         return result.scalar_one_or_none()
 
+    async def get_many(self, option_ids: Sequence[int]) -> Sequence[Option]:
+        query_obj = select(Option).where(Option.id.in_(option_ids))
+        result = await self.__session.execute(query_obj)
+        return result.scalars().all()
+
     async def get_question_options(self, question_id: int) -> Sequence[Option]:
         query_obj = select(Option).where(Option.question_id == question_id)
         result = await self.__session.execute(query_obj)
         return result.scalars().all()
 
+    @staticmethod
+    async def _invalidate(option: Option) -> None:
+        # Options are embedded in their question's response as ``variants``.
+        await get_response_cache().invalidate(
+            "options", f"option:{option.id}", f"question:{option.question_id}"
+        )
+
     async def _add_2_db(self, obj: Option) -> None:
         self.__session.add(obj)
         try:
             await self.__session.commit()
+            await self._invalidate(obj)
         except IntegrityError:
             await self.__session.rollback()
             raise HTTPException(
@@ -87,6 +94,7 @@ class OptionRepository:
         await self.__session.delete(option)
         try:
             await self.__session.commit()
+            await self._invalidate(option)
             return None
         except Exception as e:
             await self.__session.rollback()
@@ -0,0 +1,131 @@
+import logging
+
+import redis.asyncio as redis
+from fastapi import Depends
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio.session import AsyncSession
+from sqlalchemy import func
+from sqlalchemy.future import select
+
+from app.api.models import Question
+from app.core.databases.postgres import get_general_session
+from app.core.databases.redis import get_redis_connection
+from app.core.settings import get_settings, Settings
+
+logger = logging.getLogger(__name__)
+
+# Question ids start at 1, so "0" can never collide with a real member. It is kept
+# in every pool so that an empty bucket still exists and is not rebuilt each time.
+_SENTINEL = "0"
+# Held while one process warms every pool, so workers starting together do not
+# all rebuild them.
+_WARM_LOCK = "questions:pool:warming"
+
+
+class QuestionPoolRepository:
+    """Redis sets of question ids per (level, theme, type) bucket.
+
+    Drawing ``n`` questions is a single ``SRANDMEMBER`` (O(n)) instead of an
+    ``ORDER BY random()`` over the whole bucket. A missing pool is rebuilt from
+    Postgres on first use and expires after ``QUESTION_POOL_TTL`` seconds, so any
+    drift caused by writes that bypass this class heals by itself.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession = Depends(get_general_session),
+        redis_conn: redis.Redis = Depends(get_redis_connection),
+    ):
+        self.__session = session
+        self.__redis = redis_conn
+        self.__settings: Settings = get_settings()
+
+    @staticmethod
+    def _key(level_id: int, theme_id: int, type_: str) -> str:
+        return f"questions:pool:{level_id}:{theme_id}:{type_}"
+
+    async def _build(self, key: str, level_id: int, theme_id: int, type_: str) -> None:
+        result = await self.__session.execute(
+            select(Question.id).where(
+                Question.level_id == level_id,
+                Question.theme_id == theme_id,
+                Question.type == type_,
+            )
+        )
+        ids = [str(question_id) for question_id in result.scalars().all()]
+        async with self.__redis.pipeline(transaction=True) as pipe:
+            pipe.sadd(key, _SENTINEL, *ids)
+            pipe.expire(key, self.__settings.QUESTION_POOL_TTL)
+            await pipe.execute()
+
+    async def warm(self) -> int:
+        """Build every missing pool with one query; return how many were built."""
+        if not await self.__redis.set(_WARM_LOCK, 1, nx=True, ex=60):
+            return 0
+        result = await self.__session.execute(
+            select(
+                Question.level_id,
+                Question.theme_id,
+                Question.type,
+                func.array_agg(Question.id),
+            ).group_by(Question.level_id, Question.theme_id, Question.type)
+        )
+        buckets = {
+            self._key(level_id, theme_id, type_): ids
+            for level_id, theme_id, type_, ids in result.all()
+        }
+        async with self.__redis.pipeline(transaction=False) as pipe:
+            for key in buckets:
+                pipe.exists(key)
+            missing = [
+                key for key, exists in zip(buckets, await pipe.execute()) if not exists
+            ]
+        async with self.__redis.pipeline(transaction=False) as pipe:
+            for key in missing:
+                pipe.sadd(key, _SENTINEL, *map(str, buckets[key]))
+                pipe.expire(key, self.__settings.QUESTION_POOL_TTL)
+            await pipe.execute()
+        return len(missing)
+
+    async def sample(
+        self, level_id: int, theme_id: int, limit: int, type_: str = "question"
+    ) -> list[int] | None:
+        """Return up to ``limit`` distinct random ids, or ``None`` if Redis is down."""
+        key = self._key(level_id, theme_id, type_)
+        try:
+            if not await self.__redis.exists(key):
+                await self._build(key, level_id, theme_id, type_)
+            members = await self.__redis.srandmember(key, limit + 1)
+        except RedisError as e:
+            logger.warning("Question pool unavailable, falling back to SQL: %s", e)
+            return None
+        return [int(member) for member in members if member != _SENTINEL][:limit]
+
+    async def add(self, question: Question) -> None:
+        key = self._key(question.level_id, question.theme_id, question.type)
+        try:
+            # Only extend pools that already exist; a missing one is built lazily.
+            if await self.__redis.exists(key):
+                await self.__redis.sadd(key, str(question.id))
+        except RedisError as e:
+            logger.warning("Failed to add question %s to pool: %s", question.id, e)
+
+    async def move(
+        self, question: Question, level_id: int, theme_id: int, type_: str
+    ) -> None:
+        """Move a question out of the bucket it was in before an update."""
+        try:
+            await self.__redis.srem(
+                self._key(level_id, theme_id, type_), str(question.id)
+            )
+        except RedisError as e:
+            logger.warning("Failed to move question %s in pool: %s", question.id, e)
+            return
+        await self.add(question)
+
+    async def remove(self, question: Question) -> None:
+        key = self._key(question.level_id, question.theme_id, question.type)
+        try:
+            await self.__redis.srem(key, str(question.id))
+        except RedisError as e:
+            logger.warning("Failed to remove question %s from pool: %s", question.id, e)
@@ -2,7 +2,8 @@ from typing import Sequence
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio.session import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import func
+from sqlalchemy.orm import selectinload
+from sqlalchemy import delete, func
 from fastapi import Depends, HTTPException, status
 
 from app.api.models import Question
@@ -11,6 +12,9 @@ from app.api.schemas import (
     QuestionUpdateSchema,
     QuestionQueryParamSchema,
 )
+from app.api.utils.pagination import Page, fetch_page
+from app.api.utils.response_cache import get_response_cache
+from app.api.utils.search import search
 from app.core.databases.postgres import get_general_session
 
 
@@ -21,16 +25,10 @@ class QuestionRepository:
     ):
         self.__session = session
 
-    async def list_(self, query: QuestionQueryParamSchema) -> Sequence[Question]:
-        stmt = select(Question)
+    async def list_(self, query: QuestionQueryParamSchema) -> Page:
+        stmt = select(Question).options(selectinload(Question.options))
         if query.search:
-            stmt = stmt.where(Question.name.ilike(f"%{query.search}%"))
-        if query.sort:
-            if hasattr(Question, query.sort) or hasattr(Question, query.sort[1:]):
-                if query.sort.startswith("-"):
-                    stmt = stmt.order_by(getattr(Question, query.sort[1:]).desc())
-                else:
-                    stmt = stmt.order_by(getattr(Question, query.sort).asc())
+            stmt = stmt.where(search(query.search, (Question.name,)))
         if query.filter:
             if query.filter.startswith("-"):
                 stmt = stmt.where(getattr(Question, query.filter[1:]).is_(False))
@@ -40,15 +38,32 @@ class QuestionRepository:
             stmt = stmt.where(Question.level_id == query.level_id)
         if query.theme_id:
             stmt = stmt.where(Question.theme_id == query.theme_id)
-        stmt = stmt.offset(query.offset).limit(query.limit)
-        questions = await self.__session.execute(stmt)
-        return questions.scalars().all()
+        return await fetch_page(self.__session, stmt, Question, query)
 
-    async def get(self, question_id: int) -> Question | None:
-        query_obj = select(Question).where(Question.id == question_id)
+    async def get(
+        self, question_id: int, *, populate_existing: bool = False
+    ) -> Question | None:
+        query_obj = (
+            select(Question)
+            .options(selectinload(Question.options))
+            .where(Question.id == question_id)
+        )
+        if populate_existing:
+            query_obj = query_obj.execution_options(populate_existing=True)
         result = await self.__session.execute(query_obj)
         return result.scalar_one_or_none()
 
+    async def get_many(self, question_ids: Sequence[int]) -> Sequence[Question]:
+        if not question_ids:
+            return []
+        stmt = (
+            select(Question)
+            .options(selectinload(Question.options))
+            .where(Question.id.in_(question_ids))
+        )
+        result = await self.__session.execute(stmt)
+        return result.scalars().all()
+
     async def add_2_db(self, question: Question) -> Question:
         self.__session.add(question)
         try:
@@ -65,8 +80,9 @@ class QuestionRepository:
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"An error occurred while adding the question: {str(e)}",
             )
-        await self.__session.refresh(question)
-        return question
+        await get_response_cache().invalidate(f"question:{question.id}")
+        # Reload with the options eagerly attached so callers never lazy-load them.
+        return await self.get(question.id, populate_existing=True)
 
     async def post(self, payload: QuestionCreateSchema) -> Question:
         return await self.add_2_db(Question(**payload.model_dump()))
@@ -80,27 +96,40 @@ class QuestionRepository:
         question.update(payload.model_dump(exclude_unset=True))
         return await self.add_2_db(question)
 
-    async def delete(self, question_id: int) -> None:
-        question = await self.get(question_id)
-        if not question:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="Question not found."
-            )
-        await self.__session.delete(question)
+    async def delete(self, question_id: int) -> Question:
+        """Delete a question with one statement and return the removed row.
+
+        Options and user answers are removed by ON DELETE CASCADE.
+        """
         try:
+            result = await self.__session.execute(
+                delete(Question).where(Question.id == question_id).returning(Question)
+            )
+            question = result.scalar_one_or_none()
+            if question is None:
+                await self.__session.rollback()
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Question with ID {question_id} not found.",
+                )
             await self.__session.commit()
+            await get_response_cache().invalidate(f"question:{question_id}", "options")
+        except HTTPException:
+            raise
         except Exception as e:
             await self.__session.rollback()
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"An error occurred while deleting the question: {str(e)}",
             )
+        return question
 
     async def random(
         self, level_id: int, theme_id: int, limit: int
     ) -> Sequence[Question]:
         stmt = (
             select(Question)
+            .options(selectinload(Question.options))
             .where(
                 Question.level_id == level_id,
                 Question.theme_id == theme_id,
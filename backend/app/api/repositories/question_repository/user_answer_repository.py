@@ -3,39 +3,63 @@ from fastapi import Depends, HTTPException, status
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio.session import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy import func, cast, Date
 from datetime import date
 
 from app.api.schemas import UserAnswerQuery, UserAnswerCreateSchema
+from app.api.utils.pagination import Page, fetch_page
 from app.core.databases.postgres import get_general_session
-from app.api.models import UserAnswer
+from app.api.models import UserAnswer, UserStatsDaily
 
 
 class UserAnswerRepository:
     def __init__(self, session: AsyncSession = Depends(get_general_session)):
         self.__session: AsyncSession = session
 
-    async def list_(self, query: UserAnswerQuery, user_id: int) -> Sequence[UserAnswer]:
+    async def list_(self, query: UserAnswerQuery, user_id: int) -> Page:
         stmt = select(UserAnswer).where(UserAnswer.user_id == user_id)
         if query.start_date:
             stmt = stmt.where(UserAnswer.created_at >= query.start_date)
         if query.end_date:
             stmt = stmt.where(UserAnswer.created_at <= query.end_date)
-        stmt = stmt.offset(query.offset).limit(query.limit)
-        result = await self.__session.execute(stmt)
-        return result.scalars().all()
+        return await fetch_page(self.__session, stmt, UserAnswer, query)
 
     async def get(self, user_answer_id: int) -> UserAnswer | None:
         stmt = select(UserAnswer).where(UserAnswer.id == user_answer_id)
         result = await self.__session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def post(self, payload: UserAnswerCreateSchema, user_id: int) -> UserAnswer:
+    async def _bump_daily_stats(
+        self, user_id: int, answered: int, correct: int
+    ) -> None:
+        # The day is taken from the database clock, the same one that stamps
+        # user_answers.created_at, so live updates agree with the backfill.
+        stmt = insert(UserStatsDaily).values(
+            user_id=user_id,
+            day=cast(func.timezone("UTC", func.now()), Date),
+            answered=answered,
+            correct=correct,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[UserStatsDaily.user_id, UserStatsDaily.day],
+            set_={
+                "answered": UserStatsDaily.answered + stmt.excluded.answered,
+                "correct": UserStatsDaily.correct + stmt.excluded.correct,
+            },
+        )
+        await self.__session.execute(stmt)
+
+    async def post(
+        self, payload: UserAnswerCreateSchema, user_id: int, is_correct: bool
+    ) -> UserAnswer:
         user_answer = UserAnswer(**payload.model_dump(), user_id=user_id)
         try:
             self.__session.add(user_answer)
+            await self._bump_daily_stats(user_id, 1, int(is_correct))
             await self.__session.commit()
         except IntegrityError:
+            await self.__session.rollback()
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="User answer already exists for this user and question.",
@@ -49,25 +73,44 @@ class UserAnswerRepository:
         await self.__session.refresh(user_answer)
         return user_answer
 
-    async def get_correct_answers(
-        self, user_id: int, start_date: date, end_date: date
+    async def post_many(
+        self, payloads: Sequence[UserAnswerCreateSchema], user_id: int, correct: int
     ) -> Sequence[UserAnswer]:
-        stmt = select(UserAnswer).where(
-            UserAnswer.user_id == user_id,
-            UserAnswer.created_at >= start_date,
-            UserAnswer.created_at <= end_date,
-        )
-        result = await self.__session.execute(stmt)
-        return result.scalars().all()
+        stmt = insert(UserAnswer).returning(UserAnswer, sort_by_parameter_order=True)
+        try:
+            result = await self.__session.scalars(
+                stmt,
+                [{**payload.model_dump(), "user_id": user_id} for payload in payloads],
+            )
+            user_answers = result.all()
+            await self._bump_daily_stats(user_id, len(user_answers), correct)
+            await self.__session.commit()
+        except IntegrityError:
+            await self.__session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="User answer already exists for this user and question.",
+            )
+        except Exception as e:
+            await self.__session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"An error occurred while saving the user answers: {str(e)}",
+            )
+        return user_answers
 
-    async def get_total_questions(self, user_id: int) -> int:
-        stmt = (
-            select(func.count())
-            .select_from(UserAnswer)
-            .where(UserAnswer.user_id == user_id)
-        )
+    async def get_answer_stats(
+        self, user_id: int, start_date: date, end_date: date
+    ) -> tuple[int, int]:
+        """Return ``(correct answers in the window, total answers)`` from the rollup."""
+        in_window = UserStatsDaily.day.between(start_date, end_date)
+        stmt = select(
+            func.coalesce(func.sum(UserStatsDaily.correct).filter(in_window), 0),
+            func.coalesce(func.sum(UserStatsDaily.answered), 0),
+        ).where(UserStatsDaily.user_id == user_id)
         result = await self.__session.execute(stmt)
-        return result.scalar_one()
+        correct_answers, total_questions = result.one()
+        return int(correct_answers), int(total_questions)
 
     async def get_option_by_question_id(
         self, question_id: int, user_id: int
@@ -0,0 +1,87 @@
+import uuid
+from datetime import datetime, UTC
+
+import redis.asyncio as redis
+from fastapi import Depends
+
+from app.api.schemas import EntertainmentCreateSchema
+from app.core.databases.redis import get_redis_connection
+
+QUEUE_KEY = "queue:telegram_uploads"
+PROCESSING_KEY = "queue:telegram_uploads:processing"
+JOB_TTL = 7 * 24 * 60 * 60
+
+
+class UploadJobRepository:
+    """Redis-backed queue of Telegram media uploads.
+
+    Jobs are hashes under ``job:telegram_upload:<id>``. Their ids move from
+    ``QUEUE_KEY`` to ``PROCESSING_KEY`` while a worker handles them, so a job
+    interrupted by a crash can be put back with :meth:`requeue_stale`.
+    """
+
+    def __init__(self, redis_conn: redis.Redis = Depends(get_redis_connection)):
+        self.__redis = redis_conn
+
+    @staticmethod
+    def _key(job_id: str) -> str:
+        return f"job:telegram_upload:{job_id}"
+
+    async def enqueue(self, payload: EntertainmentCreateSchema) -> dict:
+        job_id = uuid.uuid4().hex
+        now = datetime.now(UTC).isoformat()
+        job = {
+            "job_id": job_id,
+            "status": "queued",
+            "attempts": 0,
+            "title": payload.title,
+            "type_id": payload.type_id,
+            "media_path": payload.media_path,
+            "media_type": payload.media_type,
+            "created_at": now,
+            "updated_at": now,
+        }
+        async with self.__redis.pipeline(transaction=True) as pipe:
+            pipe.hset(self._key(job_id), mapping=job)
+            pipe.expire(self._key(job_id), JOB_TTL)
+            pipe.lpush(QUEUE_KEY, job_id)
+            await pipe.execute()
+        return job
+
+    async def get(self, job_id: str) -> dict | None:
+        job = await self.__redis.hgetall(self._key(job_id))
+        return job or None
+
+    async def update(self, job_id: str, **fields) -> None:
+        fields["updated_at"] = datetime.now(UTC).isoformat()
+        await self.__redis.hset(self._key(job_id), mapping=fields)
+
+    async def reserve(self, timeout: int) -> str | None:
+        return await self.__redis.blmove(
+            QUEUE_KEY, PROCESSING_KEY, timeout, "RIGHT", "LEFT"
+        )
+
+    async def ack(self, job_id: str) -> None:
+        await self.__redis.lrem(PROCESSING_KEY, 0, job_id)
+
+    async def requeue_stale(self) -> int:
+        """Put jobs left in processing by a dead worker back on the queue."""
+        moved = 0
+        while await self.__redis.lmove(PROCESSING_KEY, QUEUE_KEY, "RIGHT", "RIGHT"):
+            moved += 1
+        return moved
+
+    async def depth(self) -> int:
+        return await self.__redis.llen(QUEUE_KEY)
+
+    async def lag(self) -> float:
+        """Seconds the oldest queued job has been waiting, 0 for an empty queue."""
+        # Jobs are pushed on the left and reserved from the right.
+        job_id = await self.__redis.lindex(QUEUE_KEY, -1)
+        if job_id is None:
+            return 0.0
+        created_at = await self.__redis.hget(self._key(job_id), "created_at")
+        if created_at is None:
+            return 0.0
+        waited = datetime.now(UTC) - datetime.fromisoformat(created_at)
+        return waited.total_seconds()
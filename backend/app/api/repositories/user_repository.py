@@ -1,11 +1,12 @@
-from typing import Sequence
-from sqlalchemy import or_, asc, desc, String
 from fastapi import Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from app.api.models import User
 from app.api.schemas import QueryParamsSchema, UserUpdateSchema
+from app.api.utils.principal_cache import get_principal_cache
+from app.api.utils.pagination import Page, fetch_page
+from app.api.utils.search import search
 from app.core.databases.postgres import get_general_session
 
 
@@ -29,7 +30,7 @@ class UserRepository:
         user = await self.__session.execute(select(User).where(User.id == user_id))
         return user.scalar_one_or_none()
 
-    async def list(self, params: QueryParamsSchema) -> Sequence[User]:
+    async def list(self, params: QueryParamsSchema) -> Page:
         stmt = select(User)
         if params.filter:
             field = params.filter
@@ -42,23 +43,13 @@ class UserRepository:
 
         if params.search:
             stmt = stmt.where(
-                or_(
-                    User.first_name.ilike(f"%{params.search}%"),
-                    User.last_name.ilike(f"%{params.search}%"),
-                    User.phone_number.cast(String).ilike(f"%{params.search}%"),
-                    User.telegram_id.cast(String).ilike(f"%{params.search}%"),
+                search(
+                    params.search,
+                    text_columns=(User.first_name, User.last_name),
+                    numeric_columns=(User.phone_number, User.telegram_id),
                 )
             )
-        if params.sort:
-            sort_field = params.sort.lstrip("-")
-            sort_column = getattr(User, sort_field, None)
-            if sort_column is not None:
-                order = asc if not params.sort.startswith("-") else desc
-                stmt = stmt.order_by(order(sort_column))
-        stmt = stmt.offset(params.offset).limit(params.limit)
-
-        result = await self.__session.execute(stmt)
-        return result.scalars().all()
+        return await fetch_page(self.__session, stmt, User, params)
 
     async def update(self, phone_number: int, payload: UserUpdateSchema) -> User:
         user = await self.get(phone_number)
@@ -72,4 +63,5 @@ class UserRepository:
         self.__session.add(user)
         await self.__session.commit()
         await self.__session.refresh(user)
+        await get_principal_cache().invalidate(user.id)
         return user
@@ -7,9 +7,11 @@ from app.api.schemas import (
     EntertainmentCreateSchema,
     EntertainmentUpdate,
     EntertainmentQuerySchema,
+    EntertainmentJobResponseSchema,
 )
 from app.api.utils.admin_filter import check_admin
 from app.api.utils.jwt_handler import get_current_user
+from app.api.utils.response_cache import cached_response
 
 router = APIRouter(
     prefix="/entertainment",
@@ -21,6 +23,7 @@ router = APIRouter(
 @router.get(
     "", status_code=status.HTTP_200_OK, response_model=EntertainmentListResponseSchema
 )
+@cached_response(ttl=300, tags=lambda result, **_: ["entertainments"])
 async def list_(
     query: EntertainmentQuerySchema = Depends(),
     entertainment_controller: EntertainmentController = Depends(),
@@ -33,19 +36,42 @@ async def list_(
     status_code=status.HTTP_200_OK,
     response_model=EntertainmentResponseSchema,
 )
+@cached_response(
+    ttl=300,
+    tags=lambda result, entertainment_id, **_: [
+        f"entertainment:{entertainment_id}",
+        f"entertainment_type:{result.type_id}",
+    ],
+)
 async def get(
     entertainment_id: int, entertainment_controller: EntertainmentController = Depends()
 ) -> EntertainmentResponseSchema:
     return await entertainment_controller.get(entertainment_id)
 
 
+@router.get(
+    "/jobs/{job_id}",
+    status_code=status.HTTP_200_OK,
+    response_model=EntertainmentJobResponseSchema,
+    summary="Get the status of a Telegram upload job",
+)
+async def get_job(
+    job_id: str, entertainment_controller: EntertainmentController = Depends()
+) -> EntertainmentJobResponseSchema:
+    return await entertainment_controller.get_job(job_id)
+
+
 @router.post(
-    "/", status_code=status.HTTP_201_CREATED, response_model=EntertainmentResponseSchema
+    "/",
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=EntertainmentJobResponseSchema,
+    summary="Queue a media file for upload to Telegram",
+    description="The entertainment is created by the worker once the upload is done; poll the returned job.",
 )
 async def post(
     payload: EntertainmentCreateSchema,
     entertainment_controller: EntertainmentController = Depends(),
-) -> EntertainmentResponseSchema:
+) -> EntertainmentJobResponseSchema:
     return await entertainment_controller.post(payload=payload)
 
 
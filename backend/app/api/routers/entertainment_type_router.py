@@ -3,6 +3,7 @@ from fastapi import Depends, APIRouter, status
 from app.api.controllers import EntertainmentTypeController
 from app.api.schemas import EntertainmentTypesSchema, EntertainmentTypesResponseSchema
 from app.api.utils.admin_filter import check_admin
+from app.api.utils.response_cache import cached_response
 
 router = APIRouter(
     prefix="/entertainment-type",
@@ -17,6 +18,7 @@ router = APIRouter(
     status_code=status.HTTP_200_OK,
     response_model=list[EntertainmentTypesResponseSchema],
 )
+@cached_response(ttl=600, tags=lambda result, **_: ["entertainment_types"])
 async def list_(
     entertainment_type_controller: EntertainmentTypeController = Depends(),
 ) -> list[EntertainmentTypesResponseSchema]:
@@ -28,6 +30,12 @@ async def list_(
     status_code=status.HTTP_200_OK,
     response_model=EntertainmentTypesResponseSchema,
 )
+@cached_response(
+    ttl=600,
+    tags=lambda result, entertainment_type_id, **_: [
+        f"entertainment_type:{entertainment_type_id}"
+    ],
+)
 async def get(
     entertainment_type_id: int,
     entertainment_type_controller: EntertainmentTypeController = Depends(),
@@ -1,4 +1,7 @@
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import ORJSONResponse
+
+from app.api.utils.readiness import ReadinessProbe, get_readiness_probe
 
 router = APIRouter(
     prefix="/healthcheck",
@@ -8,4 +11,26 @@ router = APIRouter(
 
 @router.get("", status_code=status.HTTP_200_OK, response_model=dict[str, str])
 async def healthcheck() -> dict[str, str]:
+    """Liveness: the process is up and serving requests."""
     return {"status": "ok", "message": "Service is running"}
+
+
+@router.get(
+    "/ready",
+    status_code=status.HTTP_200_OK,
+    summary="Readiness with dependency latency",
+    responses={503: {"description": "A dependency is down or past its threshold"}},
+)
+async def ready(
+    probe: ReadinessProbe = Depends(get_readiness_probe),
+) -> ORJSONResponse:
+    """Readiness: Postgres and Redis answer in time, the pool is within its
+    threshold, and the process is not shutting down. Upload queue and replica
+    figures are reported but never fail the check."""
+    healthy, report = await probe.check()
+    return ORJSONResponse(
+        report,
+        status_code=(
+            status.HTTP_200_OK if healthy else status.HTTP_503_SERVICE_UNAVAILABLE
+        ),
+    )
@@ -2,6 +2,7 @@ from fastapi import APIRouter, status, Depends
 
 from app.api.utils.admin_filter import check_admin
 from app.api.utils.jwt_handler import get_current_user
+from app.api.utils.response_cache import cached_response
 from app.api.controllers import LevelController
 from app.api.schemas import (
     LevelResponseSchema,
@@ -24,6 +25,7 @@ router = APIRouter(
     summary="List all levels",
     response_model=LevelListResponseSchema,
 )
+@cached_response(ttl=600, tags=lambda result, **_: ["levels"])
 async def list_(
     query: LevelQueryParamsSchema = Depends(),
     level_controller: LevelController = Depends(),
@@ -37,6 +39,7 @@ async def list_(
     summary="Get a specific level by ID",
     response_model=LevelResponseSchema,
 )
+@cached_response(ttl=600, tags=lambda result, level_id, **_: [f"level:{level_id}"])
 async def get(
     level_id: int, level_controller: LevelController = Depends()
 ) -> LevelResponseSchema:
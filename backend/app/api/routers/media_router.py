@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, status, UploadFile, File, HTTPException
+from fastapi import APIRouter, Depends, status, UploadFile, File, HTTPException, Query
 
 from app.api.schemas import MediaSchemaResponse, MediaClearSchema
 from app.api.controllers import MediaController
@@ -20,10 +20,18 @@ router = APIRouter(
 )
 async def upload(
     static: bool = False,
+    sha256: str | None = Query(
+        None,
+        pattern="^[0-9a-fA-F]{64}$",
+        description=(
+            "SHA-256 of the file. If it is already stored, the existing file is "
+            "reused instead of hashing and writing the upload again."
+        ),
+    ),
     file: UploadFile = File(...),
     media_controller: MediaController = Depends(),
 ):
-    return await media_controller.upload(file, static=static)
+    return await media_controller.upload(file, static=static, sha256=sha256)
 
 
 @router.delete(
@@ -37,7 +45,7 @@ async def clear(
     media_controller: MediaController = Depends(),
 ):
     try:
-        media_controller.clear(file_path.media_path)
+        await media_controller.clear(file_path.media_path)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
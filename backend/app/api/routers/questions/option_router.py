@@ -3,6 +3,7 @@ from fastapi import APIRouter, status, Depends, Query
 
 from app.api.controllers import OptionController
 from app.api.utils.jwt_handler import get_current_user
+from app.api.utils.response_cache import cached_response
 from app.api.schemas import (
     OptionResponseSchema,
     OptionListResponseSchema,
@@ -21,6 +22,12 @@ router = APIRouter(
     status_code=status.HTTP_200_OK,
     response_model=OptionListResponseSchema,
 )
+@cached_response(
+    ttl=300,
+    tags=lambda result, question_id, **_: (
+        ["options", f"question:{question_id}"] if question_id else ["options"]
+    ),
+)
 async def list_(
     question_id: int | None = Query(default=None),
     query: QueryParamsSchema = Depends(),
@@ -34,6 +41,13 @@ async def list_(
     status_code=status.HTTP_200_OK,
     response_model=OptionResponseSchema,
 )
+@cached_response(
+    ttl=300,
+    tags=lambda result, option_id, **_: [
+        f"option:{option_id}",
+        f"question:{result.question_id}",
+    ],
+)
 async def get(
     option_id: int,
     option_controller: OptionController = Depends(),
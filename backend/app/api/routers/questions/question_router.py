@@ -8,7 +8,9 @@ from app.api.schemas import (
     QuestionCreateSchema,
     QuestionUpdateSchema,
 )
+from app.api.utils.conditional import ConditionalRequest
 from app.api.utils.jwt_handler import get_current_user
+from app.api.utils.response_cache import cached_response
 
 router = APIRouter(
     prefix="/questions", tags=["Questions"], dependencies=[Depends(get_current_user)]
@@ -22,9 +24,10 @@ router = APIRouter(
 )
 async def list_(
     query: QuestionQueryParamSchema = Depends(),
+    conditional: ConditionalRequest = Depends(),
     controller: QuestionController = Depends(QuestionController),
 ) -> QuestionListResponseSchema:
-    return await controller.list_(query=query)
+    return await controller.list_(query=query, conditional=conditional)
 
 
 @router.get(
@@ -66,6 +69,14 @@ async def random(
     status_code=status.HTTP_200_OK,
     response_model=QuestionResponseSchema,
 )
+@cached_response(
+    ttl=300,
+    tags=lambda result, question_id, **_: [
+        f"question:{question_id}",
+        f"level:{result.level_id}",
+        f"level:{result.theme_id}",
+    ],
+)
 async def get(
     question_id: int, question_controller: QuestionController = Depends()
 ) -> QuestionResponseSchema:
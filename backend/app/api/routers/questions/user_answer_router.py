@@ -8,6 +8,8 @@ from app.api.schemas import (
     UserAnswerListResponseSchema,
     UserAnswerResponseSchema,
     UserAnswerCreateSchema,
+    UserAnswerBatchCreateSchema,
+    UserAnswerBatchResponseSchema,
 )
 
 router = APIRouter(
@@ -36,3 +38,19 @@ async def post(
     user_answer_controller: UserAnswerController = Depends(),
 ) -> UserAnswerResponseSchema:
     return await user_answer_controller.post(payload=payload, user_id=current_user.id)
+
+
+@router.post(
+    "/batch/",
+    status_code=status.HTTP_201_CREATED,
+    response_model=UserAnswerBatchResponseSchema,
+    summary="Submit all answers of a quiz at once",
+)
+async def post_many(
+    payload: UserAnswerBatchCreateSchema,
+    current_user: User = Depends(get_current_user),
+    user_answer_controller: UserAnswerController = Depends(),
+) -> UserAnswerBatchResponseSchema:
+    return await user_answer_controller.post_many(
+        payload=payload, user_id=current_user.id
+    )
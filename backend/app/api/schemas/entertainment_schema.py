@@ -72,6 +72,19 @@ class EntertainmentResponseSchema(EntertainmentBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class EntertainmentJobResponseSchema(BaseModel):
+    job_id: str
+    status: str = Field(description="One of 'queued', 'running', 'done', 'failed'.")
+    attempts: int = 0
+    entertainment_id: int | None = None
+    message_id: int | None = None
+    error: str | None = None
+    created_at: datetime
+    updated_at: datetime | None = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class EntertainmentListResponseSchema(PaginationSchema):
     filter: int | None = None
     items: list[EntertainmentResponseSchema] = Field(
@@ -24,5 +24,6 @@ class MediaClearSchema(BaseModel):
 
 class MediaSchemaResponse(MediaClearSchema):
     media_url: str
+    sha256: str | None = None
 
     model_config = ConfigDict(from_attributes=True)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 from pydantic import BaseModel, Field, ConfigDict, model_validator
-from typing import Any
+from typing import Any, Literal
 from fastapi import HTTPException, status
 
 
@@ -10,7 +10,8 @@ class PaginationSchema(BaseModel):
     search: str | None = None
     sort: str | None = None
     filter: str | None = None
-    total: int = 0
+    total: int | None = 0
+    next_cursor: str | None = None
     items: list[Any] = Field(default_factory=list)
 
     model_config = ConfigDict(from_attributes=True)
@@ -30,6 +31,18 @@ class QueryParamsSchema(BaseModel):
     search: str | None = None
     filter: str | None = None
     sort: str | None = None
+    pagination: Literal["offset", "cursor"] = Field(
+        default="offset",
+        description="'cursor' pages with next_cursor instead of page numbers.",
+    )
+    cursor: str | None = Field(
+        default=None, description="next_cursor from the previous page."
+    )
+    count: Literal["exact", "estimated", "none"] = Field(
+        default="exact",
+        description="How to compute total: exact, estimated from table "
+        "statistics (unfiltered lists only), or none.",
+    )
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -41,6 +54,10 @@ class QueryParamsSchema(BaseModel):
     def limit(self) -> int:
         return self.size
 
+    @property
+    def is_cursor(self) -> bool:
+        return self.pagination == "cursor" or self.cursor is not None
+
     @model_validator(mode="after")
     def validate_and_clamp(self) -> "QueryParamsSchema":
         if self.page < 1:
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, ConfigDict, model_validator
+from pydantic import AliasChoices, BaseModel, Field, ConfigDict, model_validator
 from datetime import datetime
 from fastapi import HTTPException, status
 
@@ -69,7 +69,10 @@ class QuestionUpdateSchema(QuestionBase):
 
 class QuestionResponseSchema(QuestionBase):
     id: int
-    variants: list[OptionResponseSchema] = Field(default_factory=list)
+    # Read from ``Question.options`` when validated from the ORM row.
+    variants: list[OptionResponseSchema] = Field(
+        default_factory=list, validation_alias=AliasChoices("variants", "options")
+    )
     created_at: datetime
     updated_at: datetime | None = None
 
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field, model_validator, ConfigDict
 from fastapi import HTTPException, status
 from datetime import date, datetime
+from typing import Literal
 
 
 class UserAnswerBase(BaseModel):
@@ -32,6 +33,47 @@ class UserAnswerResponseSchema(UserAnswerBase):
     updated_at: datetime | None = None
 
 
+class UserAnswerBatchCreateSchema(BaseModel):
+    answers: list[UserAnswerCreateSchema] = Field(
+        default_factory=list, description="Answers of one quiz, max 100"
+    )
+
+    @model_validator(mode="after")
+    def validate_answers(self):
+        if not self.answers:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="At least one answer must be provided",
+            )
+        if len(self.answers) > 100:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="No more than 100 answers can be submitted at once",
+            )
+        question_ids = [answer.question_id for answer in self.answers]
+        if len(question_ids) != len(set(question_ids)):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Each question can be answered only once per submission",
+            )
+        return self
+
+
+class UserAnswerResultSchema(UserAnswerResponseSchema):
+    is_correct: bool
+
+
+class UserAnswerBatchResponseSchema(BaseModel):
+    total: int = Field(default=0, description="Number of submitted answers")
+    correct_answers: int = Field(default=0, description="Number of correct answers")
+    score: float = Field(default=0.0, description="Percentage of correct answers")
+    items: list[UserAnswerResultSchema] = Field(
+        default_factory=list, description="Saved answers with their correctness"
+    )
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class UserAnswerQuery(BaseModel):
     start_date: date | None = Field(
         default=date.today(), description="Default to 2024-01-01"
@@ -45,6 +87,18 @@ class UserAnswerQuery(BaseModel):
     size: int = Field(
         default=10, ge=1, le=100, description="Number of items per page, max 100"
     )
+    pagination: Literal["offset", "cursor"] = Field(
+        default="offset",
+        description="'cursor' pages with next_cursor instead of page numbers.",
+    )
+    cursor: str | None = Field(
+        default=None, description="next_cursor from the previous page."
+    )
+    count: Literal["exact", "estimated", "none"] = Field(
+        default="exact",
+        description="How to compute total: exact, estimated from table "
+        "statistics (unfiltered lists only), or none.",
+    )
 
     @model_validator(mode="after")
     def validate_page_and_size(self):
@@ -68,11 +122,18 @@ class UserAnswerQuery(BaseModel):
     def limit(self) -> int:
         return self.size
 
+    @property
+    def is_cursor(self) -> bool:
+        return self.pagination == "cursor" or self.cursor is not None
+
     model_config = ConfigDict(from_attributes=True)
 
 
 class UserAnswerListResponseSchema(UserAnswerQuery):
-    total: int = Field(default=0, description="Total number of user answers")
+    total: int | None = Field(default=0, description="Total number of user answers")
+    next_cursor: str | None = Field(
+        default=None, description="Cursor of the next page, if there is one"
+    )
     correct_answers: int = Field(default=0, description="Number of correct answers")
     total_questions: int = Field(
         default=0, description="Total number of questions answered"
@@ -0,0 +1,132 @@
+import hashlib
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Iterable, Mapping
+
+from fastapi import HTTPException, Request, Response, status
+from pydantic import BaseModel
+
+# Responses are per user and must be revalidated before every reuse.
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: Any) -> str:
+    """Strong ETag over ``parts``; equal parts always give the same tag."""
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, str):
+            part = part.encode()
+        elif not isinstance(part, bytes):
+            part = repr(part).encode()
+        digest.update(part)
+        digest.update(b"\x00")
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def _changed_at(row: Any) -> datetime | None:
+    return getattr(row, "updated_at", None) or getattr(row, "created_at", None)
+
+
+def rows_etag(rows: Iterable[Any], *extra: Any) -> str:
+    """ETag of a collection from the ``(id, updated_at)`` of its rows.
+
+    The id set makes deletions change the tag, which ``max(updated_at)`` alone
+    would miss. ``extra`` covers whatever else the response carries, e.g.
+    nested rows or the page total.
+    """
+    return make_etag(*((row.id, _changed_at(row)) for row in rows), *extra)
+
+
+def last_modified(result: Any) -> datetime | None:
+    """``Last-Modified`` of a single resource, ``None`` for collections.
+
+    A collection has no trustworthy modification time: removing one of its
+    rows does not move ``max(updated_at)``, so ``If-Modified-Since`` would
+    wrongly answer 304. Collections are validated by ETag only.
+    """
+    if not isinstance(result, BaseModel):
+        return None
+    return _changed_at(result)
+
+
+def validator_headers(etag: str, modified: datetime | None = None) -> dict[str, str]:
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if modified is not None:
+        if modified.tzinfo is None:
+            modified = modified.replace(tzinfo=UTC)
+        headers["Last-Modified"] = format_datetime(modified.astimezone(UTC), True)
+    return headers
+
+
+def _parse_http_date(value: str) -> datetime | None:
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    return parsed
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison.
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag.removeprefix("W/") in candidates
+
+
+def is_not_modified(
+    headers: Mapping[str, str], etag: str | None, modified: str | datetime | None
+) -> bool:
+    """Evaluate ``If-None-Match`` / ``If-Modified-Since`` as RFC 9110 says.
+
+    ``If-Modified-Since`` is only looked at when ``If-None-Match`` is absent.
+    """
+    if_none_match = headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag is not None and _etag_matches(if_none_match, etag)
+    if_modified_since = headers.get("if-modified-since")
+    if if_modified_since is None or modified is None:
+        return False
+    if isinstance(modified, str):
+        modified = _parse_http_date(modified)
+    elif modified.tzinfo is None:
+        modified = modified.replace(tzinfo=UTC)
+    since = _parse_http_date(if_modified_since)
+    if modified is None or since is None:
+        return False
+    # HTTP dates have a resolution of one second.
+    return modified.replace(microsecond=0) <= since
+
+
+def not_modified(headers: Mapping[str, str]) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=dict(headers))
+
+
+class ConditionalRequest:
+    """Answer conditional GETs from validators known before serialization.
+
+    Controllers compute the ETag from the rows they fetched and call
+    :meth:`evaluate`; a match raises a 304 so the response schema is never
+    built, anything else stamps the validators on the 200 response.
+    """
+
+    def __init__(self, request: Request, response: Response):
+        self.__request = request
+        self.__response = response
+
+    def evaluate(self, etag: str, modified: datetime | None = None) -> dict[str, str]:
+        """Raise a 304 on a match, else return the validators for the 200.
+
+        The validators are also set on the injected response, which covers
+        endpoints returning a model; endpoints returning a ``Response`` must
+        pass them on themselves.
+        """
+        headers = validator_headers(etag, modified)
+        if is_not_modified(self.__request.headers, etag, modified):
+            raise HTTPException(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers=headers
+            )
+        self.__response.headers.update(headers)
+        return headers
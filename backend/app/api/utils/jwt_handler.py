@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from app.api.models.user import User
+from app.api.utils.principal_cache import get_principal_cache
 from app.core.databases.postgres import get_general_session
 from app.core.settings import Settings, get_settings
 
@@ -70,14 +71,17 @@ class JWTHandler:
 
     async def get_user_from_token(self, token: str, session: AsyncSession) -> User:
         payload = self.decode_token(token)
-        phone_number = payload.get("phone_number") or None
+        user_id = payload.get("id") or None
 
-        if phone_number:
-            result = await session.execute(
-                select(User).where(User.phone_number == phone_number)
-            )
+        if user_id:
+            principal_cache = get_principal_cache()
+            user = await principal_cache.get(user_id)
+            if user:
+                return user
+            result = await session.execute(select(User).where(User.id == user_id))
             user = result.scalar_one_or_none()
             if user:
+                await principal_cache.set(user)
                 return user
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -0,0 +1,131 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from functools import cache
+
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+from sqlalchemy import select
+
+from app.api.models import Level
+from app.core.databases.postgres import get_session_without_depends
+from app.core.databases.redis import get_redis_pool
+from app.core.settings import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "levels:changed"
+VERSION_KEY = "levels:version"
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogLevel:
+    id: int
+    name: str
+    type: str
+    picture: str | None
+
+
+class LevelCatalog:
+    """In-memory copy of the ``levels`` table shared by every request of a worker.
+
+    Writes through :class:`LevelRepository` bump ``levels:version`` in Redis and
+    publish it on ``levels:changed``; every worker listening on the channel
+    drops its copy and reloads it on the next lookup. ``LEVEL_CATALOG_TTL``
+    bounds staleness if a notification is lost while Redis is unreachable.
+    """
+
+    def __init__(self, settings: Settings) -> None:
+        self.__ttl = settings.LEVEL_CATALOG_TTL
+        self.__levels: dict[int, CatalogLevel] = {}
+        self.__version: int | None = None
+        self.__loaded_at = 0.0
+        self.__stale = True
+        self.__lock = asyncio.Lock()
+        self.__listener: asyncio.Task | None = None
+        self.__redis = redis.Redis(connection_pool=get_redis_pool())
+
+    @property
+    def version(self) -> int | None:
+        return self.__version
+
+    async def _remote_version(self) -> int | None:
+        try:
+            version = await self.__redis.get(VERSION_KEY)
+        except RedisError as e:
+            logger.warning("Level catalog version unavailable: %s", e)
+            return None
+        return int(version) if version is not None else 0
+
+    async def load(self) -> None:
+        async with self.__lock:
+            # Cleared before the reads, so a notification arriving while they
+            # run marks the new copy stale again instead of being lost.
+            self.__stale = False
+            try:
+                # Read the version first so a write racing with the load leaves
+                # us behind, never ahead, of the data we hold.
+                version = await self._remote_version()
+                async with get_session_without_depends() as session:
+                    rows = await session.execute(
+                        select(Level.id, Level.name, Level.type, Level.picture)
+                    )
+            except BaseException:
+                self.__stale = True
+                raise
+            self.__levels = {row.id: CatalogLevel(*row) for row in rows}
+            self.__version = version
+            self.__loaded_at = time.monotonic()
+
+    async def get(self, level_id: int) -> CatalogLevel | None:
+        if self.__stale or time.monotonic() - self.__loaded_at > self.__ttl:
+            await self.load()
+        return self.__levels.get(level_id)
+
+    async def invalidate(self) -> None:
+        """Mark every worker's catalog stale after a write to ``levels``."""
+        self.__stale = True
+        try:
+            version = await self.__redis.incr(VERSION_KEY)
+            await self.__redis.publish(CHANNEL, version)
+        except RedisError as e:
+            logger.warning("Failed to publish level catalog change: %s", e)
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async with self.__redis.pubsub() as pubsub:
+                    await pubsub.subscribe(CHANNEL)
+                    # Anything published while we were not subscribed is lost.
+                    self.__stale = True
+                    async for message in pubsub.listen():
+                        if message["type"] != "message":
+                            continue
+                        if self.__version is None or int(message["data"]) > (
+                            self.__version
+                        ):
+                            self.__stale = True
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Level catalog listener failed, retrying: %s", e)
+                await asyncio.sleep(1)
+
+    def start(self) -> None:
+        if self.__listener is None:
+            self.__listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self.__listener is not None:
+            self.__listener.cancel()
+            try:
+                await self.__listener
+            except asyncio.CancelledError:
+                pass
+            self.__listener = None
+
+
+@cache
+def get_level_catalog() -> LevelCatalog:
+    return LevelCatalog(get_settings())
@@ -0,0 +1,177 @@
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import Any, NamedTuple, Sequence, TypeVar
+
+from fastapi import HTTPException, status
+from sqlalchemy import Column, Select, func, inspect, select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+T = TypeVar("T")
+
+
+class Page(NamedTuple):
+    items: Sequence[Any]
+    total: int | None
+    next_cursor: str | None
+
+
+def _bad_request(detail: str) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+
+def _sort_column(model, params) -> tuple[Column | None, bool]:
+    sort = getattr(params, "sort", None)
+    if not sort:
+        return None, False
+    column = inspect(model).columns.get(sort.lstrip("-"))
+    if column is None and params.is_cursor:
+        raise _bad_request(f"Cannot sort by '{sort.lstrip('-')}'.")
+    return column, sort.startswith("-")
+
+
+def _dump(value: Any) -> Any:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def _load(column: Column, value: Any) -> Any:
+    if value is None:
+        return None
+    python_type = column.type.python_type
+    if issubclass(python_type, (date, datetime)):
+        return python_type.fromisoformat(value)
+    # JSON has no separate float type, so whole numbers may come back as int.
+    accepted = (int, float) if python_type is float else python_type
+    if not isinstance(value, accepted) or (
+        isinstance(value, bool) and python_type is not bool
+    ):
+        raise _bad_request("Invalid cursor.")
+    return value
+
+
+def encode_cursor(sort: str | None, values: Sequence[Any]) -> str:
+    payload = json.dumps({"s": sort, "k": [_dump(value) for value in values]})
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str | None, length: int) -> list[Any]:
+    """Key values of ``cursor``: ``length`` scalars, the last one an id."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded))
+        values = payload["k"]
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise _bad_request("Invalid cursor.")
+    if payload.get("s") != sort:
+        raise _bad_request("Cursor was issued for a different sort.")
+    if (
+        not isinstance(values, list)
+        or len(values) != length
+        or not all(isinstance(value, (str, int, float)) for value in values)
+        or not isinstance(values[-1], int)
+        or isinstance(values[-1], bool)
+    ):
+        raise _bad_request("Invalid cursor.")
+    return values
+
+
+def paginate(stmt: Select, model, params) -> Select:
+    """Apply ``params.sort`` and the page window to ``stmt``.
+
+    Rows are always ordered by the sort column and then ``id``, which makes
+    pages stable. In offset mode the window is ``OFFSET/LIMIT``; in cursor
+    mode the query seeks past the last row of the previous page with a
+    ``(sort, id) > (...)`` comparison and fetches one extra row so
+    :func:`split_page` can tell whether another page exists.
+    """
+    column, descending = _sort_column(model, params)
+    if column is not None and column.nullable and params.is_cursor:
+        raise _bad_request(
+            f"Cursor pagination cannot sort by nullable field '{column.key}'."
+        )
+    keys = [getattr(model, column.key)] if column is not None else []
+    keys.append(model.id)
+    stmt = stmt.order_by(*(key.desc() if descending else key for key in keys))
+    if not params.is_cursor:
+        return stmt.offset(params.offset).limit(params.limit)
+
+    if params.cursor:
+        values = decode_cursor(params.cursor, getattr(params, "sort", None), len(keys))
+        if column is not None:
+            try:
+                values[0] = _load(column, values[0])
+            except (TypeError, ValueError):
+                raise _bad_request("Invalid cursor.")
+        position = tuple_(*keys)
+        bound = tuple_(*values)
+        stmt = stmt.where(position < bound if descending else position > bound)
+    return stmt.limit(params.size + 1)
+
+
+def split_page(rows: Sequence[T], params) -> tuple[Sequence[T], str | None]:
+    """Trim the look-ahead row of a cursor page and build ``next_cursor``."""
+    if not params.is_cursor or len(rows) <= params.size:
+        return rows, None
+    rows = rows[: params.size]
+    last = rows[-1]
+    sort = getattr(params, "sort", None)
+    values = [getattr(last, sort.lstrip("-"))] if sort else []
+    values.append(last.id)
+    return rows, encode_cursor(sort, values)
+
+
+async def _estimate(session: AsyncSession, table: str) -> int | None:
+    """Row count from planner statistics; ``None`` if the table was never analyzed."""
+    estimate = await session.scalar(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:t AS regclass)"),
+        {"t": table},
+    )
+    if estimate is None or estimate < 0:
+        return None
+    return estimate
+
+
+async def fetch_page(session: AsyncSession, stmt: Select, model, params) -> Page:
+    """Run ``stmt`` as one page of ``model`` rows and work out ``total``.
+
+    ``params.count`` picks how the total is computed:
+
+    * ``exact`` adds ``count(*) OVER ()`` to the page query, so the total comes
+      back with the rows instead of from a second scan. Later cursor pages
+      skip it; the client already has the total from the first page.
+    * ``estimated`` reads ``pg_class.reltuples`` for unfiltered lists and falls
+      back to ``exact`` when a WHERE clause makes the estimate meaningless.
+    * ``none`` leaves ``total`` empty.
+    """
+    count = getattr(params, "count", "exact")
+    total = None
+    if count == "estimated":
+        if stmt.whereclause is None:
+            total = await _estimate(session, model.__tablename__)
+        if total is None:
+            count = "exact"
+    windowed = count == "exact" and not (params.is_cursor and params.cursor)
+
+    page_stmt = paginate(stmt, model, params)
+    if windowed:
+        page_stmt = page_stmt.add_columns(func.count().over().label("total"))
+    result = await session.execute(page_stmt)
+    if windowed:
+        rows = result.all()
+        items = [row[0] for row in rows]
+        if rows:
+            total = rows[0][1]
+        elif params.is_cursor or params.offset == 0:
+            total = 0
+        else:
+            # Past the last page there is no row to carry the window count.
+            total = await session.scalar(
+                select(func.count()).select_from(stmt.order_by(None).subquery())
+            )
+    else:
+        items = result.scalars().all()
+    items, next_cursor = split_page(items, params)
+    return Page(items, total, next_cursor)
@@ -0,0 +1,114 @@
+import json
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime
+from functools import cache
+
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+
+from app.api.models.user import User
+from app.core.databases.redis import get_redis_pool
+from app.core.settings import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+
+_COLUMNS = (
+    "id",
+    "first_name",
+    "last_name",
+    "telegram_id",
+    "language",
+    "phone_number",
+    "profile_picture",
+    "is_admin",
+)
+_DATETIME_COLUMNS = ("created_at", "updated_at")
+
+
+class PrincipalCache:
+    """Two-level cache of authenticated users keyed by the token's ``id`` claim.
+
+    The in-process LRU answers most lookups without any I/O. Redis is shared by
+    all workers and is invalidated on user updates; the local entries of other
+    workers can lag behind for at most ``PRINCIPAL_CACHE_LOCAL_TTL`` seconds.
+    """
+
+    def __init__(self, settings: Settings) -> None:
+        self.__ttl = settings.PRINCIPAL_CACHE_TTL
+        self.__local_ttl = settings.PRINCIPAL_CACHE_LOCAL_TTL
+        self.__max_size = settings.PRINCIPAL_CACHE_SIZE
+        self.__local: OrderedDict[int, tuple[float, dict]] = OrderedDict()
+        self.__redis = redis.Redis(connection_pool=get_redis_pool())
+
+    @staticmethod
+    def _key(user_id: int) -> str:
+        return f"principal:{user_id}"
+
+    @staticmethod
+    def _dump(user: User) -> dict:
+        data = {column: getattr(user, column) for column in _COLUMNS}
+        for column in _DATETIME_COLUMNS:
+            value = getattr(user, column)
+            data[column] = value.isoformat() if value else None
+        return data
+
+    @staticmethod
+    def _load(data: dict) -> User:
+        values = dict(data)
+        for column in _DATETIME_COLUMNS:
+            if values.get(column):
+                values[column] = datetime.fromisoformat(values[column])
+        return User(**values)
+
+    def _get_local(self, user_id: int) -> dict | None:
+        entry = self.__local.get(user_id)
+        if entry is None:
+            return None
+        expires_at, data = entry
+        if expires_at < time.monotonic():
+            del self.__local[user_id]
+            return None
+        self.__local.move_to_end(user_id)
+        return data
+
+    def _set_local(self, user_id: int, data: dict) -> None:
+        self.__local[user_id] = (time.monotonic() + self.__local_ttl, data)
+        self.__local.move_to_end(user_id)
+        while len(self.__local) > self.__max_size:
+            self.__local.popitem(last=False)
+
+    async def get(self, user_id: int) -> User | None:
+        data = self._get_local(user_id)
+        if data is None:
+            try:
+                raw = await self.__redis.get(self._key(user_id))
+            except RedisError as e:
+                logger.warning("Principal cache unavailable: %s", e)
+                return None
+            if raw is None:
+                return None
+            data = json.loads(raw)
+            self._set_local(user_id, data)
+        return self._load(data)
+
+    async def set(self, user: User) -> None:
+        data = self._dump(user)
+        self._set_local(user.id, data)
+        try:
+            await self.__redis.set(self._key(user.id), json.dumps(data), ex=self.__ttl)
+        except RedisError as e:
+            logger.warning("Principal cache unavailable: %s", e)
+
+    async def invalidate(self, user_id: int) -> None:
+        self.__local.pop(user_id, None)
+        try:
+            await self.__redis.delete(self._key(user_id))
+        except RedisError as e:
+            logger.warning("Failed to invalidate principal %s: %s", user_id, e)
+
+
+@cache
+def get_principal_cache() -> PrincipalCache:
+    return PrincipalCache(get_settings())
@@ -0,0 +1,140 @@
+import asyncio
+import time
+from functools import cache
+from typing import Any, Awaitable
+
+import redis.asyncio as redis
+from sqlalchemy import text
+
+from app.api.repositories.upload_job_repository import UploadJobRepository
+from app.core.databases.postgres import get_async_engine, get_replica_monitor
+from app.core.databases.redis import get_redis_pool
+from app.core.lifecycle import get_lifecycle
+from app.core.settings import Settings, get_settings
+
+
+async def _timed(awaitable: Awaitable, timeout: float) -> tuple[Any, float]:
+    started = time.perf_counter()
+    result = await asyncio.wait_for(awaitable, timeout)
+    return result, round((time.perf_counter() - started) * 1000, 2)
+
+
+def _failure(e: Exception, timeout: float) -> dict[str, Any]:
+    if isinstance(e, TimeoutError):
+        return {"ok": False, "error": f"timed out after {timeout}s"}
+    return {"ok": False, "error": str(e) or type(e).__name__}
+
+
+class ReadinessProbe:
+    """Dependency checks behind ``/healthcheck/ready``.
+
+    Every check has a hard timeout, so a stuck dependency makes the probe
+    fail fast instead of hanging it. The report is reused for
+    ``HEALTH_CACHE_TTL`` seconds and concurrent probes wait for one run.
+    """
+
+    def __init__(self, settings: Settings) -> None:
+        self.__settings = settings
+        self.__redis = redis.Redis(connection_pool=get_redis_pool())
+        self.__lock = asyncio.Lock()
+        self.__report: tuple[bool, dict[str, Any]] | None = None
+        self.__checked_at = 0.0
+
+    def _fresh(self) -> bool:
+        return (
+            self.__report is not None
+            and time.monotonic() - self.__checked_at < self.__settings.HEALTH_CACHE_TTL
+        )
+
+    async def check(self) -> tuple[bool, dict[str, Any]]:
+        if self._fresh():
+            return self.__report
+        async with self.__lock:
+            if not self._fresh():
+                self.__report = await self._run()
+                self.__checked_at = time.monotonic()
+        return self.__report
+
+    async def _select_one(self) -> None:
+        # Includes the pool checkout: an exhausted pool shows up as a timeout.
+        async with get_async_engine().connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+    async def _database(self) -> dict[str, Any]:
+        timeout = self.__settings.HEALTH_DB_TIMEOUT
+        try:
+            _, latency = await _timed(self._select_one(), timeout)
+        except Exception as e:
+            return _failure(e, timeout)
+        return {"ok": True, "latency_ms": latency}
+
+    def _pool(self) -> dict[str, Any]:
+        pool = get_async_engine().sync_engine.pool
+        capacity = self.__settings.DB_POOL_SIZE + self.__settings.DB_MAX_OVERFLOW
+        checked_out = pool.checkedout()
+        utilization = round(checked_out / capacity, 2) if capacity else 1.0
+        return {
+            "ok": utilization <= self.__settings.HEALTH_MAX_POOL_UTILIZATION,
+            "checked_out": checked_out,
+            "capacity": capacity,
+            "utilization": utilization,
+        }
+
+    async def _redis(self) -> dict[str, Any]:
+        timeout = self.__settings.HEALTH_REDIS_TIMEOUT
+        try:
+            _, latency = await _timed(self.__redis.ping(), timeout)
+        except Exception as e:
+            return _failure(e, timeout)
+        return {"ok": True, "latency_ms": latency}
+
+    async def _upload_queue(self) -> dict[str, Any]:
+        # Informational: only the worker drains the queue, so a backlog says
+        # nothing about whether this process can serve requests.
+        timeout = self.__settings.HEALTH_REDIS_TIMEOUT
+        jobs = UploadJobRepository(self.__redis)
+        try:
+            (depth, lag), _ = await _timed(
+                asyncio.gather(jobs.depth(), jobs.lag()), timeout
+            )
+        except Exception as e:
+            return _failure(e, timeout)
+        return {
+            "ok": True,
+            "depth": depth,
+            "lag_seconds": round(lag, 1),
+        }
+
+    @staticmethod
+    def _replica() -> dict[str, Any] | None:
+        # Informational: with the replica down reads fall back to the primary.
+        monitor = get_replica_monitor()
+        if monitor is None:
+            return None
+        return {
+            "ok": True,
+            "serving_reads": monitor.healthy,
+            "lag_seconds": monitor.lag,
+        }
+
+    async def _run(self) -> tuple[bool, dict[str, Any]]:
+        database, redis_check, upload_queue = await asyncio.gather(
+            self._database(), self._redis(), self._upload_queue()
+        )
+        checks = {
+            "lifecycle": {"ok": get_lifecycle().ready},
+            "database": database,
+            "database_pool": self._pool(),
+            "redis": redis_check,
+            "upload_queue": upload_queue,
+        }
+        replica = self._replica()
+        if replica is not None:
+            checks["replica"] = replica
+        healthy = all(check["ok"] for check in checks.values())
+        return healthy, {"status": "ready" if healthy else "unavailable", **checks}
+
+
+@cache
+def get_readiness_probe() -> ReadinessProbe:
+    return ReadinessProbe(get_settings())
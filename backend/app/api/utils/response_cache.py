@@ -0,0 +1,195 @@
+import functools
+import inspect
+import logging
+from functools import cache
+from typing import Any, Callable, Iterable, NamedTuple
+from urllib.parse import urlencode
+
+import redis.asyncio as redis
+from fastapi import Request, Response
+from pydantic_core import to_json
+from redis.exceptions import RedisError
+
+from app.api.utils.conditional import (
+    is_not_modified,
+    last_modified,
+    make_etag,
+    not_modified,
+    validator_headers,
+)
+from app.core.databases.postgres import primary_reads
+from app.core.databases.redis import get_redis_pool
+
+logger = logging.getLogger(__name__)
+
+TagsFactory = Callable[..., Iterable[str]]
+
+
+class CachedResponse(NamedTuple):
+    body: str | None
+    etag: str | None
+    last_modified: str | None
+
+
+class ResponseCache:
+    """Serialized GET responses in Redis, invalidated by tag.
+
+    Each entry is a hash under ``cache:response:<path>?<sorted query>`` with
+    the body and its ``ETag``/``Last-Modified`` validators. Every tag of the
+    entry is a set ``cache:tag:<tag>`` holding the keys it covers;
+    :meth:`invalidate` deletes those keys together with the set.
+    """
+
+    def __init__(self) -> None:
+        self.__redis = redis.Redis(connection_pool=get_redis_pool())
+
+    @staticmethod
+    def key(request: Request) -> str:
+        query = urlencode(sorted(request.query_params.multi_items()))
+        return f"cache:response:{request.url.path}?{query}"
+
+    @staticmethod
+    def _tag_key(tag: str) -> str:
+        return f"cache:tag:{tag}"
+
+    async def validators(self, key: str) -> CachedResponse:
+        """The entry's validators only, to answer a conditional GET cheaply."""
+        try:
+            etag, modified = await self.__redis.hmget(key, "etag", "last_modified")
+        except RedisError as e:
+            logger.warning("Response cache unavailable: %s", e)
+            return CachedResponse(None, None, None)
+        return CachedResponse(None, etag, modified)
+
+    async def get(self, key: str) -> CachedResponse:
+        try:
+            return CachedResponse(
+                *await self.__redis.hmget(key, "body", "etag", "last_modified")
+            )
+        except RedisError as e:
+            logger.warning("Response cache unavailable: %s", e)
+            return CachedResponse(None, None, None)
+
+    async def set(
+        self,
+        key: str,
+        body: str,
+        headers: dict[str, str],
+        ttl: int,
+        tags: Iterable[str],
+    ) -> None:
+        entry = {"body": body, "etag": headers["ETag"]}
+        if "Last-Modified" in headers:
+            entry["last_modified"] = headers["Last-Modified"]
+        try:
+            async with self.__redis.pipeline(transaction=True) as pipe:
+                pipe.delete(key)
+                pipe.hset(key, mapping=entry)
+                pipe.expire(key, ttl)
+                for tag in tags:
+                    tag_key = self._tag_key(tag)
+                    pipe.sadd(tag_key, key)
+                    # Keep the tag at least as long as its longest-lived entry.
+                    pipe.expire(tag_key, ttl, nx=True)
+                    pipe.expire(tag_key, ttl, gt=True)
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning("Failed to cache response %s: %s", key, e)
+
+    async def invalidate(self, *tags: str) -> None:
+        tag_keys = [self._tag_key(tag) for tag in tags]
+        try:
+            async with self.__redis.pipeline(transaction=False) as pipe:
+                for tag_key in tag_keys:
+                    pipe.smembers(tag_key)
+                members = await pipe.execute()
+            keys = set().union(*members)
+            await self.__redis.delete(*keys, *tag_keys)
+        except RedisError as e:
+            logger.warning("Failed to invalidate cached responses %s: %s", tags, e)
+
+
+@cache
+def get_response_cache() -> ResponseCache:
+    return ResponseCache()
+
+
+def _cached_headers(cached: CachedResponse, cache_status: str) -> dict[str, str]:
+    if cached.etag is None:
+        return {"X-Cache": cache_status}
+    headers = validator_headers(cached.etag)
+    if cached.last_modified is not None:
+        headers["Last-Modified"] = cached.last_modified
+    headers["X-Cache"] = cache_status
+    return headers
+
+
+def cached_response(*, ttl: int, tags: TagsFactory) -> Callable:
+    """Cache the JSON body of a GET endpoint.
+
+    ``tags`` is called with the endpoint's result and keyword arguments and
+    returns the tags to file the entry under, e.g.
+    ``lambda result, question_id, **_: [f"question:{question_id}"]``. A cached
+    body is returned as is, skipping the controller and ``response_model``
+    validation; errors raised by the endpoint are never cached.
+
+    Responses carry an ETag hashed from the body, and single resources a
+    ``Last-Modified`` from their ``updated_at``. A conditional request that
+    matches a cached entry gets a 304 from the validators alone.
+
+    Misses read from the primary: an entry filled from a lagging replica
+    right after an invalidation would serve the old rows for the whole TTL.
+    """
+
+    def decorator(endpoint: Callable) -> Callable:
+        signature = inspect.signature(endpoint)
+        wants_request = "request" in signature.parameters
+        parameters = list(signature.parameters.values())
+        if not wants_request:
+            parameters.append(
+                inspect.Parameter(
+                    "request", inspect.Parameter.KEYWORD_ONLY, annotation=Request
+                )
+            )
+
+        @functools.wraps(endpoint)
+        async def wrapper(*args, **kwargs) -> Any:
+            request: Request = (
+                kwargs["request"] if wants_request else kwargs.pop("request")
+            )
+            response_cache = get_response_cache()
+            key = response_cache.key(request)
+            conditional = "if-none-match" in request.headers or (
+                "if-modified-since" in request.headers
+            )
+            if conditional:
+                cached = await response_cache.validators(key)
+                if cached.etag is not None and is_not_modified(
+                    request.headers, cached.etag, cached.last_modified
+                ):
+                    return not_modified(_cached_headers(cached, "HIT"))
+            cached = await response_cache.get(key)
+            if cached.body is not None:
+                return Response(
+                    cached.body,
+                    media_type="application/json",
+                    headers=_cached_headers(cached, "HIT"),
+                )
+            result = await endpoint(*args, **kwargs)
+            # Controllers on the fast path hand back bytes already.
+            body = result.body if isinstance(result, Response) else to_json(result)
+            headers = validator_headers(make_etag(body), last_modified(result))
+            await response_cache.set(
+                key, body.decode(), headers, ttl, tags(result, **kwargs)
+            )
+            headers["X-Cache"] = "MISS"
+            if is_not_modified(
+                request.headers, headers["ETag"], headers.get("Last-Modified")
+            ):
+                return not_modified(headers)
+            return Response(body, media_type="application/json", headers=headers)
+
+        wrapper.__signature__ = signature.replace(parameters=parameters)
+        return primary_reads(wrapper)
+
+    return decorator
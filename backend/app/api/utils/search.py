@@ -0,0 +1,49 @@
+from sqlalchemy import ColumnElement, and_, false, or_
+
+# bigint holds at most 19 digits.
+_MAX_DIGITS = 19
+_MAX_BIGINT = 2**63 - 1
+
+
+def _escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def contains(column, term: str) -> ColumnElement[bool]:
+    """Case-insensitive substring match, served by a ``gin_trgm_ops`` index."""
+    return column.ilike(f"%{_escape_like(term)}%", escape="\\")
+
+
+def numeric_prefix(column, digits: str) -> ColumnElement[bool]:
+    """Match integers whose decimal form starts with ``digits``.
+
+    Expressed as one ``BETWEEN`` per possible length, so the B-tree index on
+    ``column`` is used instead of casting every row to text.
+    """
+    if not digits or digits.startswith("0") or len(digits) > _MAX_DIGITS:
+        return false()
+    prefix = int(digits)
+    ranges = []
+    for extra in range(_MAX_DIGITS - len(digits) + 1):
+        scale = 10**extra
+        low, high = prefix * scale, (prefix + 1) * scale - 1
+        # Bounds past the bigint range cannot be bound as parameters.
+        if low > _MAX_BIGINT:
+            break
+        ranges.append(and_(column >= low, column <= min(high, _MAX_BIGINT)))
+    return or_(*ranges) if ranges else false()
+
+
+def search(
+    term: str, text_columns: tuple = (), numeric_columns: tuple = ()
+) -> ColumnElement[bool]:
+    """Build the WHERE clause of a ``search`` parameter.
+
+    Digit-only terms are prefix lookups on ``numeric_columns`` when there are
+    any; everything else is a substring match on ``text_columns``.
+    """
+    term = term.strip()
+    digits = term.removeprefix("+")
+    if numeric_columns and digits.isdigit():
+        return or_(*(numeric_prefix(column, digits) for column in numeric_columns))
+    return or_(*(contains(column, term) for column in text_columns))
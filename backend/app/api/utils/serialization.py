@@ -0,0 +1,46 @@
+from functools import cache
+from typing import Any, Mapping
+
+from fastapi import Response, status
+from pydantic import TypeAdapter
+
+
+@cache
+def get_type_adapter(schema: Any) -> TypeAdapter:
+    """One adapter per response type; building the core schema is the slow part."""
+    return TypeAdapter(schema)
+
+
+def dump_json(schema: Any, data: Any) -> bytes:
+    """Validate ``data`` against ``schema`` once and serialize it to JSON bytes.
+
+    ``data`` may hold ORM rows anywhere a schema with ``from_attributes`` is
+    expected; validation and encoding both run in pydantic-core without
+    building intermediate dicts.
+    """
+    adapter = get_type_adapter(schema)
+    return adapter.dump_json(adapter.validate_python(data, from_attributes=True))
+
+
+class SerializedResponse(Response):
+    """JSON response around bytes produced by :func:`dump_json`.
+
+    FastAPI returns ``Response`` instances as they are, so an endpoint that
+    returns one skips the second ``response_model`` validation and
+    ``jsonable_encoder`` pass. Keep ``response_model`` on the route for the
+    OpenAPI schema.
+    """
+
+    media_type = "application/json"
+
+
+def serialized(
+    schema: Any,
+    data: Any,
+    *,
+    status_code: int = status.HTTP_200_OK,
+    headers: Mapping[str, str] | None = None,
+) -> SerializedResponse:
+    return SerializedResponse(
+        dump_json(schema, data), status_code=status_code, headers=headers
+    )
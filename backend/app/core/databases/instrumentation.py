@@ -0,0 +1,114 @@
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PARAMETER = re.compile(r"\$\d+|%\(\w+\)s|\?")
+# Expanded IN lists differ in length only; fold them to one placeholder.
+_PARAMETER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+
+
+class RepeatedQueryError(RuntimeError):
+    """Raised in strict mode when a statement shape repeats too often."""
+
+
+@dataclass(slots=True)
+class QueryStats:
+    """Statements run while handling one request.
+
+    ``repeat_limit`` is the strict-mode threshold: the statement that would run
+    one shape more than that many times raises :class:`RepeatedQueryError`
+    instead of executing. ``None`` only records.
+    """
+
+    repeat_limit: int | None = None
+    count: int = 0
+    duration: float = 0.0
+    fingerprints: Counter = field(default_factory=Counter)
+
+    def repeated(self, threshold: int) -> dict[str, int]:
+        return {
+            fingerprint: count
+            for fingerprint, count in self.fingerprints.most_common()
+            if count > threshold
+        }
+
+
+_query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def start_query_stats(repeat_limit: int | None = None) -> QueryStats:
+    """Collect statements run from the current context into a fresh record."""
+    stats = QueryStats(repeat_limit=repeat_limit)
+    _query_stats.set(stats)
+    return stats
+
+
+def get_query_stats() -> QueryStats | None:
+    return _query_stats.get()
+
+
+@lru_cache(maxsize=2048)
+def fingerprint(statement: str) -> str:
+    """Statement shape with literals and bound parameters masked.
+
+    SQLAlchemy's compiled cache hands the same string back for the same
+    query, so the cache keeps this off the hot path.
+    """
+    shape = _STRING.sub("?", statement)
+    shape = _PARAMETER.sub("?", shape)
+    shape = _NUMBER.sub("?", shape)
+    shape = _PARAMETER_LIST.sub("(?)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _query_stats.get()
+    if stats is None:
+        return
+    shape = fingerprint(statement)
+    stats.count += 1
+    stats.fingerprints[shape] += 1
+    if stats.repeat_limit is not None and stats.fingerprints[shape] > (
+        stats.repeat_limit
+    ):
+        raise RepeatedQueryError(
+            f"Statement ran {stats.fingerprints[shape]} times in one request "
+            f"(limit {stats.repeat_limit}), probably an N+1 loop: {shape}"
+        )
+    # Only now: handle_error, which pops it, never sees errors raised above.
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _query_stats.get()
+    started = conn.info.get("query_started")
+    if stats is None or not started:
+        return
+    stats.duration += time.perf_counter() - started.pop()
+
+
+def _handle_error(exception_context) -> None:
+    # A failed statement never reaches after_cursor_execute.
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_started"):
+        connection.info["query_started"].pop()
+
+
+def instrument(engine: Engine) -> None:
+    """Record every statement of ``engine`` into the current :class:`QueryStats`.
+
+    Pass ``AsyncEngine.sync_engine`` for async engines; SQLAlchemy runs the
+    events in a greenlet that shares the request's context variables.
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
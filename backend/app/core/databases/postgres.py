@@ -1,26 +1,176 @@
+import asyncio
+import logging
 from contextlib import asynccontextmanager
 from functools import cache
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Callable
+from uuid import uuid4
 
+from fastapi import Request
+from sqlalchemy import Select, event, make_url, text
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
 )
-from app.core.settings import get_settings
+from sqlalchemy.orm import Session
+from app.core.databases.instrumentation import instrument
+from app.core.metrics import TimedQueuePool, instrument_pool
+from app.core.settings import Settings, get_settings
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+def engine_options(settings: Settings) -> dict[str, Any]:
+    """Keyword arguments of ``create_async_engine`` for ``settings``."""
+    connect_args: dict[str, Any] = {
+        # asyncpg's own cache, used for statements outside SQLAlchemy.
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        # SQLAlchemy's per-connection cache of prepared statements.
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+    }
+    if settings.DB_PGBOUNCER:
+        # pgbouncer hands each transaction a possibly different server
+        # connection: nothing may be cached across transactions, and names
+        # must be unique so two clients never collide on one server session.
+        connect_args.update(
+            statement_cache_size=0,
+            prepared_statement_cache_size=0,
+            prepared_statement_name_func=lambda: f"__asyncpg_{uuid4()}__",
+        )
+    return dict(
+        poolclass=TimedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args=connect_args,
+        future=True,
+        echo=False,
+    )
 
 
 @cache
 def get_async_engine():
-    return create_async_engine(
+    engine = create_async_engine(
         "postgresql+asyncpg://" + settings.get_postgres_url,
-        pool_size=3,
-        max_overflow=5,
-        future=True,
-        echo=False,
+        **engine_options(settings),
     )
+    instrument(engine.sync_engine)
+    instrument_pool(engine.sync_engine)
+    return engine
+
+
+@cache
+def get_replica_engine() -> AsyncEngine | None:
+    if not settings.POSTGRES_REPLICA_URL:
+        return None
+    url = make_url(settings.POSTGRES_REPLICA_URL).set(drivername="postgresql+asyncpg")
+    engine = create_async_engine(url, **engine_options(settings))
+    instrument(engine.sync_engine)
+
+    @event.listens_for(engine.sync_engine, "handle_error")
+    def _replica_down(context) -> None:
+        # Stop routing to a replica that drops connections until the monitor
+        # sees it healthy again.
+        if context.is_disconnect or context.connection is None:
+            get_replica_monitor().mark_down(context.original_exception)
+
+    return engine
+
+
+# 0 when fully caught up, NULL before anything was replayed.
+_REPLICA_LAG = text(
+    "SELECT CASE"
+    " WHEN NOT pg_is_in_recovery() THEN 0"
+    " WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0"
+    " ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())"
+    " END"
+)
+
+
+class ReplicaMonitor:
+    """Tracks whether the replica may serve reads.
+
+    It starts out down: processes that never run :meth:`run` (the bot, the
+    worker) keep every query on the primary.
+    """
+
+    def __init__(self, engine: AsyncEngine, settings: Settings) -> None:
+        self.__engine = engine
+        self.__max_lag = settings.DB_REPLICA_MAX_LAG
+        self.__interval = settings.DB_REPLICA_CHECK_INTERVAL
+        self.healthy = False
+        self.lag: float | None = None
+
+    def mark_down(self, reason: object) -> None:
+        if self.healthy:
+            logger.warning("Replica unavailable, reading from primary: %s", reason)
+        self.healthy = False
+
+    async def check(self) -> None:
+        try:
+            async with self.__engine.connect() as connection:
+                lag = await connection.scalar(_REPLICA_LAG)
+        except Exception as e:
+            self.lag = None
+            self.mark_down(e)
+            return
+        self.lag = float(lag) if lag is not None else None
+        if self.lag is None or self.lag > self.__max_lag:
+            self.mark_down(f"replication lag {self.lag}s")
+            return
+        if not self.healthy:
+            logger.info("Replica healthy, lag %.2fs", self.lag)
+        self.healthy = True
+
+    async def run(self) -> None:
+        while True:
+            await self.check()
+            await asyncio.sleep(self.__interval)
+
+
+@cache
+def get_replica_monitor() -> ReplicaMonitor | None:
+    engine = get_replica_engine()
+    return ReplicaMonitor(engine, settings) if engine is not None else None
+
+
+class RoutingSession(Session):
+    """Session sending plain reads to the replica when the session allows it.
+
+    ``info["replica"]`` opts a session in. Flushes, DML, ``FOR UPDATE``
+    selects and anything after the session first wrote stay on the primary,
+    so a session always reads its own writes.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        primary = get_async_engine().sync_engine
+        if (
+            not self.info.get("replica")
+            or self.info.get("wrote")
+            or self._flushing
+            or not isinstance(clause, Select)
+            or clause._for_update_arg is not None
+        ):
+            return primary
+        monitor = get_replica_monitor()
+        if monitor is None or not monitor.healthy:
+            return primary
+        return get_replica_engine().sync_engine
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _after_flush(session, flush_context) -> None:
+    session.info["wrote"] = True
+
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def _pin_writes(state) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        state.session.info["wrote"] = True
 
 
 @cache
@@ -28,14 +178,29 @@ def get_general_session_maker() -> async_sessionmaker[AsyncSession]:
     engine = get_async_engine()
     return async_sessionmaker(
         bind=engine,
+        sync_session_class=RoutingSession,
         autoflush=False,
         expire_on_commit=False,  # Prevent object expiration after commit
     )
 
 
-async def get_general_session() -> AsyncGenerator[AsyncSession, None]:
+def primary_reads(endpoint: Callable) -> Callable:
+    """Mark a GET endpoint whose reads must not come from the replica."""
+    endpoint.primary_reads = True
+    return endpoint
+
+
+async def get_general_session(
+    request: Request,
+) -> AsyncGenerator[AsyncSession, None]:
     session_maker = get_general_session_maker()
     async with session_maker() as session:
+        # Only safe requests read from the replica; a request that writes
+        # reads everything, including what it checks beforehand, from the
+        # primary. So do endpoints marked with primary_reads.
+        session.info["replica"] = request.method in ("GET", "HEAD") and not getattr(
+            request.scope.get("endpoint"), "primary_reads", False
+        )
         try:
             yield session
         finally:
@@ -43,13 +208,41 @@ async def get_general_session() -> AsyncGenerator[AsyncSession, None]:
 
 
 @asynccontextmanager
-async def get_session_without_depends() -> AsyncGenerator[AsyncSession, None]:
-    engine = get_async_engine()
-    session_maker = async_sessionmaker(
-        bind=engine, autoflush=False, autocommit=False, expire_on_commit=False
-    )
-    async with session_maker() as session:
+async def get_session_without_depends(
+    replica: bool = False,
+) -> AsyncGenerator[AsyncSession, None]:
+    async with get_general_session_maker()() as session:
+        # Off by default: scripts and the worker mostly read what they write.
+        session.info["replica"] = replica
         try:
             yield session
         finally:
             await session.close()
+
+
+async def log_pool_budget() -> None:
+    """Log the connections the API may open in total against the server limit."""
+    per_process = settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
+    budget = per_process * settings.WEB_CONCURRENCY
+    try:
+        async with get_async_engine().connect() as connection:
+            max_connections = int(await connection.scalar(text("SHOW max_connections")))
+    except Exception as e:
+        logger.warning("Could not read max_connections: %s", e)
+        max_connections = None
+    logger.log(
+        (
+            logging.WARNING
+            if max_connections is not None and budget >= max_connections
+            else logging.INFO
+        ),
+        "Database pool: %d + %d overflow per process x %d workers = %d connections "
+        "(server max_connections=%s, pgbouncer=%s, statement cache=%s)",
+        settings.DB_POOL_SIZE,
+        settings.DB_MAX_OVERFLOW,
+        settings.WEB_CONCURRENCY,
+        budget,
+        max_connections,
+        settings.DB_PGBOUNCER,
+        0 if settings.DB_PGBOUNCER else settings.DB_STATEMENT_CACHE_SIZE,
+    )
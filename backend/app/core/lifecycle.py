@@ -0,0 +1,20 @@
+from functools import cache
+
+
+class Lifecycle:
+    """Liveness and readiness of this API process.
+
+    The process is live as long as it answers at all. It is ready from the
+    end of startup until shutdown begins. In-flight requests are drained by
+    uvicorn itself (``--timeout-graceful-shutdown``), which stops accepting
+    connections on SIGTERM and waits for them before running the lifespan
+    shutdown.
+    """
+
+    def __init__(self) -> None:
+        self.ready = False
+
+
+@cache
+def get_lifecycle() -> Lifecycle:
+    return Lifecycle()
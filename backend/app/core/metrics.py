@@ -0,0 +1,162 @@
+"""Prometheus metrics shared by the API, the bot and the worker.
+
+Under several uvicorn workers every process writes its samples to files in
+``PROMETHEUS_MULTIPROC_DIR``, which ``/metrics`` aggregates; the variable must
+be set, and the directory emptied, before the processes start. Without it
+the metrics live in the default in-process registry.
+"""
+
+import asyncio
+import logging
+import os
+import time
+
+import redis.asyncio as redis
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from redis.exceptions import RedisError
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.databases.redis import get_redis_pool
+
+logger = logging.getLogger(__name__)
+
+MULTIPROCESS = "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ("method", "route", "status"),
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests being handled.",
+    ("method",),
+    multiprocess_mode="livesum",
+)
+
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "Database connections handed out by the pool.",
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow",
+    "Database connections open beyond pool_size.",
+    multiprocess_mode="livesum",
+)
+DB_POOL_WAIT_SECONDS = Histogram(
+    "db_pool_wait_seconds",
+    "Time spent waiting for a database connection from the pool.",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 30),
+)
+DB_POOL_TIMEOUTS = Counter(
+    "db_pool_timeouts",
+    "Checkouts that gave up waiting for a database connection.",
+)
+
+REDIS_POOL_IN_USE = Gauge(
+    "redis_pool_in_use",
+    "Redis connections checked out of the pool.",
+    multiprocess_mode="livesum",
+)
+REDIS_POOL_MAX = Gauge(
+    "redis_pool_max_connections",
+    "Redis pool capacity.",
+    multiprocess_mode="livesum",
+)
+
+TELEGRAM_REQUEST_SECONDS = Histogram(
+    "telegram_request_duration_seconds",
+    "Bot API call latency by method.",
+    ("method", "outcome"),
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+
+UPLOAD_QUEUE_DEPTH = Gauge(
+    "upload_queue_depth",
+    "Telegram upload jobs waiting in the queue.",
+    multiprocess_mode="mostrecent",
+)
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long checkouts wait for a connection."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            DB_POOL_TIMEOUTS.inc()
+            raise
+        finally:
+            DB_POOL_WAIT_SECONDS.observe(time.perf_counter() - started)
+
+
+def instrument_pool(engine) -> None:
+    """Track checked-out and overflow connections of ``engine``'s pool."""
+    pool = engine.pool
+
+    def checked_out(*_) -> None:
+        DB_POOL_CHECKED_OUT.set(pool.checkedout())
+        DB_POOL_OVERFLOW.set(max(pool.overflow(), 0))
+
+    def checked_in(*_) -> None:
+        # "checkin" fires before the pool takes the connection back, so the
+        # counters still include it. The pool then queues it, or closes it
+        # as overflow when the queue is already full.
+        overflow = pool.overflow()
+        if pool.checkedin() >= pool.size():
+            overflow -= 1
+        DB_POOL_CHECKED_OUT.set(pool.checkedout() - 1)
+        DB_POOL_OVERFLOW.set(max(overflow, 0))
+
+    event.listen(engine, "checkout", checked_out)
+    event.listen(engine, "checkin", checked_in)
+
+
+async def sample_redis(interval: float = 5.0) -> None:
+    """Refresh the Redis pool and upload queue gauges every ``interval`` seconds.
+
+    Neither has an event to hook, so they are polled; the queue is shared by
+    every process and the most recent reading wins.
+    """
+    # Imported lazily: repositories import the engine, which imports this module.
+    from app.api.repositories.upload_job_repository import QUEUE_KEY
+
+    pool = get_redis_pool()
+    connection = redis.Redis(connection_pool=pool)
+    REDIS_POOL_MAX.set(pool.max_connections)
+    while True:
+        REDIS_POOL_IN_USE.set(len(pool._in_use_connections))
+        try:
+            UPLOAD_QUEUE_DEPTH.set(await connection.llen(QUEUE_KEY))
+        except RedisError as e:
+            logger.warning("Upload queue depth unavailable: %s", e)
+        await asyncio.sleep(interval)
+
+
+def render_metrics() -> tuple[bytes, str]:
+    if not MULTIPROCESS:
+        return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead() -> None:
+    """Drop this process's live gauges; call on shutdown."""
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(os.getpid())
@@ -0,0 +1,128 @@
+"""Add user_stats_daily rollup
+
+Revision ID: 5b1e7c9d2a4f
+Revises: 44a87584aecd
+Create Date: 2026-10-18 10:12:41.318204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "5b1e7c9d2a4f"
+down_revision: Union[str, None] = "44a87584aecd"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Same grouping as backfill_stats.rebuild_user_stats: days are UTC dates.
+BACKFILL = """
+INSERT INTO user_stats_daily (user_id, day, answered, correct)
+SELECT a.user_id,
+       (a.created_at AT TIME ZONE 'UTC')::date AS day,
+       count(*),
+       count(*) FILTER (WHERE o.is_correct)
+FROM user_answers AS a
+JOIN options AS o ON o.id = a.option_id
+GROUP BY a.user_id, day
+"""
+
+# The application adds to the rollup when it inserts answers. Answers also
+# disappear through ON DELETE CASCADE from questions and levels, and an
+# option's is_correct can be edited; neither passes through the application,
+# so the database corrects the rollup itself.
+RECOUNT_AFTER_DELETE = """
+CREATE FUNCTION user_stats_daily_recount() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    UPDATE user_stats_daily AS s
+    SET answered = r.answered, correct = r.correct
+    FROM (
+        SELECT d.user_id,
+               d.day,
+               count(a.id) AS answered,
+               count(a.id) FILTER (WHERE o.is_correct) AS correct
+        FROM (
+            SELECT DISTINCT user_id, (created_at AT TIME ZONE 'UTC')::date AS day
+            FROM deleted_answers
+        ) AS d
+        LEFT JOIN user_answers AS a
+            ON a.user_id = d.user_id
+            AND (a.created_at AT TIME ZONE 'UTC')::date = d.day
+        LEFT JOIN options AS o ON o.id = a.option_id
+        GROUP BY d.user_id, d.day
+    ) AS r
+    WHERE s.user_id = r.user_id AND s.day = r.day;
+    RETURN NULL;
+END
+$$;
+
+CREATE TRIGGER user_answers_stats_delete
+AFTER DELETE ON user_answers
+REFERENCING OLD TABLE AS deleted_answers
+FOR EACH STATEMENT EXECUTE FUNCTION user_stats_daily_recount();
+"""
+
+SHIFT_AFTER_OPTION_UPDATE = """
+CREATE FUNCTION user_stats_daily_option_changed() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    UPDATE user_stats_daily AS s
+    SET correct = s.correct + CASE WHEN NEW.is_correct THEN r.answers
+                                   ELSE -r.answers END
+    FROM (
+        SELECT user_id,
+               (created_at AT TIME ZONE 'UTC')::date AS day,
+               count(*) AS answers
+        FROM user_answers
+        WHERE option_id = NEW.id
+        GROUP BY user_id, day
+    ) AS r
+    WHERE s.user_id = r.user_id AND s.day = r.day;
+    RETURN NULL;
+END
+$$;
+
+CREATE TRIGGER options_stats_is_correct
+AFTER UPDATE OF is_correct ON options
+FOR EACH ROW WHEN (OLD.is_correct IS DISTINCT FROM NEW.is_correct)
+EXECUTE FUNCTION user_stats_daily_option_changed();
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_stats_daily",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("answered", sa.Integer(), nullable=False),
+        sa.Column("correct", sa.Integer(), nullable=False),
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("user_id", "day", name="uq_user_stats_daily_user_day"),
+    )
+    op.create_index(
+        op.f("ix_user_stats_daily_id"), "user_stats_daily", ["id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_user_stats_daily_user_id"),
+        "user_stats_daily",
+        ["user_id"],
+        unique=False,
+    )
+    op.execute(BACKFILL)
+    op.execute(RECOUNT_AFTER_DELETE)
+    op.execute(SHIFT_AFTER_OPTION_UPDATE)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER options_stats_is_correct ON options")
+    op.execute("DROP FUNCTION user_stats_daily_option_changed()")
+    op.execute("DROP TRIGGER user_answers_stats_delete ON user_answers")
+    op.execute("DROP FUNCTION user_stats_daily_recount()")
+    op.drop_index(op.f("ix_user_stats_daily_user_id"), table_name="user_stats_daily")
+    op.drop_index(op.f("ix_user_stats_daily_id"), table_name="user_stats_daily")
+    op.drop_table("user_stats_daily")
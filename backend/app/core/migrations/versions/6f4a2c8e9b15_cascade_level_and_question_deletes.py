@@ -0,0 +1,42 @@
+"""Cascade level and question deletes in the database
+
+Revision ID: 6f4a2c8e9b15
+Revises: 2d9e4b7a1c63
+Create Date: 2026-10-18 21:48:06.271390
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6f4a2c8e9b15"
+down_revision: Union[str, None] = "2d9e4b7a1c63"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (constraint, table, column, referred table); names are the Postgres defaults
+# given to the unnamed constraints of the initial migration.
+FOREIGN_KEYS = (
+    ("questions_level_id_fkey", "questions", "level_id", "levels"),
+    ("questions_theme_id_fkey", "questions", "theme_id", "levels"),
+    ("options_question_id_fkey", "options", "question_id", "questions"),
+    ("user_answers_question_id_fkey", "user_answers", "question_id", "questions"),
+)
+
+
+def _recreate(ondelete: str | None) -> None:
+    for name, table, column, referred in FOREIGN_KEYS:
+        op.drop_constraint(name, table, type_="foreignkey")
+        op.create_foreign_key(
+            name, table, referred, [column], ["id"], ondelete=ondelete
+        )
+
+
+def upgrade() -> None:
+    _recreate("CASCADE")
+
+
+def downgrade() -> None:
+    _recreate(None)
@@ -0,0 +1,51 @@
+"""Add media_objects for the content-addressed media store
+
+Revision ID: 8c3f1a6e5d27
+Revises: 5b1e7c9d2a4f
+Create Date: 2026-10-18 20:03:15.552817
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "8c3f1a6e5d27"
+down_revision: Union[str, None] = "5b1e7c9d2a4f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "media_objects",
+        sa.Column("sha256", sa.String(length=64), nullable=False),
+        sa.Column("static", sa.Boolean(), nullable=False),
+        sa.Column("path", sa.String(length=255), nullable=False),
+        sa.Column("size", sa.BigInteger(), nullable=False),
+        sa.Column("ref_count", sa.Integer(), nullable=False),
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("path"),
+        sa.UniqueConstraint("sha256", "static", name="uq_media_objects_sha256_static"),
+    )
+    op.create_index(op.f("ix_media_objects_id"), "media_objects", ["id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_media_objects_id"), table_name="media_objects")
+    op.drop_table("media_objects")
@@ -1,10 +1,18 @@
 import os
+
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from starlette.middleware.cors import CORSMiddleware
 
 from app.api.routers import main_router
+from app.api.routers.metrics import router as metrics_router
+from app.server.lifespan import lifespan
+from app.server.middleware import (
+    ConditionalGetMiddleware,
+    MetricsMiddleware,
+    QueryStatsMiddleware,
+)
 
 
 def get_ready() -> None:
@@ -19,14 +27,21 @@ def get_app() -> FastAPI:
         description="An AI-powered English learning platform",
         version="1.0.0",
         docs_url="/api/docs/",
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
     )
 
     app.include_router(main_router)
+    app.include_router(metrics_router)
     return app
 
 
 def create_app() -> FastAPI:
     app = get_app()
+    app.add_middleware(ConditionalGetMiddleware)
+    # Wraps ConditionalGetMiddleware so the timing covers the whole request.
+    app.add_middleware(QueryStatsMiddleware)
+    app.add_middleware(MetricsMiddleware)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
@@ -3,9 +3,10 @@ import sys
 import asyncio
 from aiogram import Dispatcher
 from aiogram.fsm.storage.redis import RedisStorage
+from prometheus_client import start_http_server
 
 from app.api.routers.bot import main_router
-from app.api.bot.main import get_bot
+from app.api.bot.main import get_bot, set_default_commands
 from app.core.settings import get_settings, Settings
 
 settings: Settings = get_settings()
@@ -19,10 +20,13 @@ dp = Dispatcher(storage=storage)
 
 async def main() -> None:
     bot = await get_bot()
+    await set_default_commands(bot)
     dp.include_router(main_router)
     await dp.start_polling(bot)
 
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO, stream=sys.stdout)
+    if settings.METRICS_PORT:
+        start_http_server(settings.METRICS_PORT)
     asyncio.run(main())
@@ -0,0 +1,94 @@
+import asyncio
+import logging
+from contextlib import AsyncExitStack, asynccontextmanager
+
+import redis.asyncio as redis
+from fastapi import FastAPI
+from sqlalchemy import text
+
+from app.api.bot.main import close_bot
+from app.api.repositories import QuestionPoolRepository
+from app.api.utils.level_catalog import get_level_catalog
+from app.core.databases.postgres import (
+    get_async_engine,
+    get_replica_engine,
+    get_replica_monitor,
+    get_session_without_depends,
+    log_pool_budget,
+)
+from app.core.databases.redis import get_redis_pool
+from app.core.lifecycle import get_lifecycle
+from app.core.metrics import mark_process_dead, sample_redis
+from app.core.settings import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+
+
+async def open_pool_connections(count: int) -> None:
+    """Check ``count`` connections out at once so the pool keeps them open."""
+    async with AsyncExitStack() as stack:
+        for _ in range(count):
+            connection = await stack.enter_async_context(get_async_engine().connect())
+            await connection.execute(text("SELECT 1"))
+
+
+async def warm_up(settings: Settings) -> None:
+    """Open connections and fill caches before the first request.
+
+    Failures are logged, not raised: the process still starts, and the
+    readiness check reports whatever is down.
+    """
+    try:
+        await open_pool_connections(min(settings.DB_POOL_WARMUP, settings.DB_POOL_SIZE))
+    except Exception as e:
+        logger.warning("Database warm-up failed: %s", e)
+    redis_conn = redis.Redis(connection_pool=get_redis_pool())
+    try:
+        await redis_conn.ping()
+        async with get_session_without_depends() as session:
+            built = await QuestionPoolRepository(session, redis_conn).warm()
+        if built:
+            logger.info("Built %d question pools", built)
+    except Exception as e:
+        logger.warning("Redis warm-up failed: %s", e)
+    try:
+        await get_level_catalog().load()
+    except Exception as e:
+        # The catalog stays stale and loads on the first lookup instead.
+        logger.warning("Level catalog warm-up failed: %s", e)
+
+
+async def dispose() -> None:
+    await close_bot()
+    await get_async_engine().dispose()
+    replica = get_replica_engine()
+    if replica is not None:
+        await replica.dispose()
+    await get_redis_pool().aclose()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    settings = get_settings()
+    lifecycle = get_lifecycle()
+
+    await log_pool_budget()
+    await warm_up(settings)
+    level_catalog = get_level_catalog()
+    level_catalog.start()
+    tasks = [asyncio.create_task(sample_redis())]
+    replica_monitor = get_replica_monitor()
+    if replica_monitor is not None:
+        await replica_monitor.check()
+        tasks.append(asyncio.create_task(replica_monitor.run()))
+    lifecycle.ready = True
+    try:
+        yield
+    finally:
+        lifecycle.ready = False
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await level_catalog.stop()
+        await dispose()
+        mark_process_dead()
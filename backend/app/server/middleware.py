@@ -0,0 +1,194 @@
+import logging
+import time
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.api.utils.conditional import CACHE_CONTROL, is_not_modified, make_etag
+from app.core.databases.instrumentation import start_query_stats
+from app.core.metrics import HTTP_REQUEST_SECONDS, HTTP_REQUESTS_IN_PROGRESS
+from app.core.settings import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+
+# Headers a 304 has to repeat from the 200 it stands for.
+_KEPT_ON_304 = ("etag", "last-modified", "cache-control", "vary", "x-cache")
+
+
+class ConditionalGetMiddleware:
+    """Turn GET responses the client already holds into 304s.
+
+    Responses that come with an ``ETag`` or ``Last-Modified`` (controllers
+    using :class:`ConditionalRequest`, cached routes, media files) are checked
+    against ``If-None-Match``/``If-Modified-Since`` and streamed through
+    untouched when they do not match. JSON responses without validators are
+    buffered and given an ETag hashed from their body, which still saves the
+    transfer even though the work to build them is already done.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        start: Message | None = None
+        chunks: list[bytes] = []
+        mode = "pass"
+
+        async def send_not_modified(headers: Headers) -> None:
+            kept = [
+                (name.encode("latin-1"), value.encode("latin-1"))
+                for name, value in headers.items()
+                if name in _KEPT_ON_304
+            ]
+            await send({"type": "http.response.start", "status": 304, "headers": kept})
+            await send({"type": "http.response.body", "body": b""})
+
+        async def conditional_send(message: Message) -> None:
+            nonlocal start, mode
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                if message["status"] != 200:
+                    mode = "pass"
+                elif "etag" in headers or "last-modified" in headers:
+                    if is_not_modified(
+                        request_headers,
+                        headers.get("etag"),
+                        headers.get("last-modified"),
+                    ):
+                        mode = "drop"
+                        await send_not_modified(headers)
+                        return
+                elif headers.get("content-type", "").startswith("application/json"):
+                    mode = "buffer"
+                    start = message
+                    return
+                await send(message)
+                return
+
+            if mode == "drop":
+                return
+            if mode == "pass":
+                await send(message)
+                return
+
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+            body = b"".join(chunks)
+            headers = MutableHeaders(raw=start["headers"])
+            headers["ETag"] = make_etag(body)
+            headers.setdefault("Cache-Control", CACHE_CONTROL)
+            if is_not_modified(request_headers, headers["etag"], None):
+                await send_not_modified(headers)
+                return
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, conditional_send)
+
+
+class QueryStatsMiddleware:
+    """Measure the SQL each request runs.
+
+    Statement count and database time go out as a ``Server-Timing`` header
+    and, with the statement shapes that repeated more than
+    ``SQL_REPEAT_LIMIT`` times, as one structured log record per request.
+    With ``SQL_STRICT`` such a repeat raises instead, which is meant for test
+    runs.
+    """
+
+    def __init__(self, app: ASGIApp, settings: Settings | None = None) -> None:
+        self.app = app
+        settings = settings or get_settings()
+        self.repeat_limit = settings.SQL_REPEAT_LIMIT
+        self.strict = settings.SQL_STRICT
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = start_query_stats(self.repeat_limit if self.strict else None)
+        started = time.perf_counter()
+        status_code = None
+
+        async def timed_send(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                total = (time.perf_counter() - started) * 1000
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing",
+                    f'db;dur={stats.duration * 1000:.1f};desc="{stats.count} queries", '
+                    f"app;dur={total:.1f}",
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, timed_send)
+        finally:
+            repeated = stats.repeated(self.repeat_limit)
+            logger.log(
+                logging.WARNING if repeated else logging.INFO,
+                "%s %s: %d queries in %.1f ms",
+                scope["method"],
+                scope["path"],
+                stats.count,
+                stats.duration * 1000,
+                extra={
+                    "sql": {
+                        "method": scope["method"],
+                        "path": scope["path"],
+                        "status": status_code,
+                        "queries": stats.count,
+                        "db_ms": round(stats.duration * 1000, 1),
+                        "total_ms": round((time.perf_counter() - started) * 1000, 1),
+                        "repeated": repeated,
+                    }
+                },
+            )
+
+
+class MetricsMiddleware:
+    """Per-route latency histogram and in-flight gauge for HTTP requests.
+
+    Routes are labelled with their template (``/api/v1/level/{level_id}``),
+    which the router leaves in the scope once it has matched.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            in_progress.dec()
+            route = scope.get("route")
+            HTTP_REQUEST_SECONDS.labels(
+                method,
+                getattr(route, "path_format", "<unmatched>"),
+                status_code,
+            ).observe(time.perf_counter() - started)
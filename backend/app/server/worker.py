@@ -0,0 +1,140 @@
+import asyncio
+import logging
+import sys
+
+import redis.asyncio as redis
+from prometheus_client import start_http_server
+from aiogram import Bot
+from aiogram.exceptions import (
+    TelegramNetworkError,
+    TelegramRetryAfter,
+    TelegramServerError,
+)
+
+from app.api.bot.main import get_bot, close_bot
+from app.api.bot.media import send_media
+from app.api.controllers import MediaController
+from app.api.repositories import (
+    EntertainmentRepository,
+    MediaRepository,
+    UploadJobRepository,
+)
+from app.api.schemas import EntertainmentCreateSchema
+from app.core.databases.postgres import get_session_without_depends
+from app.core.databases.redis import get_redis_pool
+from app.core.metrics import UPLOAD_QUEUE_DEPTH
+from app.core.settings import get_settings, Settings
+
+settings: Settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+async def upload_with_retry(
+    bot: Bot, job_id: str, job: dict, jobs: UploadJobRepository
+) -> int:
+    attempt = int(job.get("attempts", 0))
+    while True:
+        attempt += 1
+        await jobs.update(job_id, status="running", attempts=attempt)
+        try:
+            return await send_media(
+                bot,
+                chat_id=settings.TG_CHANNEL_ID,
+                media_path=job["media_path"],
+                media_type=job["media_type"],
+                caption=job["title"],
+            )
+        except TelegramRetryAfter as e:
+            if attempt >= settings.UPLOAD_MAX_ATTEMPTS:
+                raise
+            # Flood control tells us exactly how long to wait.
+            delay = e.retry_after
+        except (TelegramNetworkError, TelegramServerError):
+            if attempt >= settings.UPLOAD_MAX_ATTEMPTS:
+                raise
+            delay = settings.UPLOAD_RETRY_BASE_DELAY * 2 ** (attempt - 1)
+        logger.warning(
+            "Upload job %s attempt %s failed, retrying in %ss", job_id, attempt, delay
+        )
+        await asyncio.sleep(delay)
+
+
+async def handle(bot: Bot, job_id: str, jobs: UploadJobRepository) -> None:
+    """Run one upload job, skipping the steps an earlier attempt finished.
+
+    A job requeued after a crash may already have been uploaded or saved, so
+    each step is recorded on the job as soon as it succeeds: ``message_id``
+    after the upload, ``entertainment_id`` after the insert and
+    ``media_released`` after the file reference is dropped.
+    """
+    job = await jobs.get(job_id)
+    if job is None or job.get("status") == "done":
+        return
+
+    if job.get("message_id"):
+        message_id = int(job["message_id"])
+    else:
+        try:
+            message_id = await upload_with_retry(bot, job_id, job, jobs)
+        except Exception as e:
+            logger.exception("Upload job %s failed", job_id)
+            await jobs.update(job_id, status="failed", error=str(e))
+            return
+        await jobs.update(job_id, message_id=message_id)
+
+    if not job.get("entertainment_id"):
+        payload = EntertainmentCreateSchema(
+            title=job["title"],
+            type_id=int(job["type_id"]),
+            media_path=job["media_path"],
+            media_type=job["media_type"],
+        )
+        try:
+            async with get_session_without_depends() as session:
+                repository = EntertainmentRepository(session)
+                # The insert may have committed just before a crash.
+                entertainment = await repository.get_by_message_id(
+                    message_id
+                ) or await repository.post(payload, message_id=message_id)
+        except Exception as e:
+            logger.exception("Upload job %s could not be saved", job_id)
+            await jobs.update(job_id, status="failed", error=str(e))
+            return
+        await jobs.update(job_id, entertainment_id=entertainment.id)
+
+    # The file now lives on Telegram; drop this upload's reference to it.
+    if not job.get("media_released"):
+        try:
+            async with get_session_without_depends() as session:
+                await MediaController(MediaRepository(session)).clear(job["media_path"])
+        except Exception:
+            logger.exception("Upload job %s could not release its media", job_id)
+        await jobs.update(job_id, media_released=1)
+    await jobs.update(job_id, status="done")
+
+
+async def main() -> None:
+    jobs = UploadJobRepository(redis.Redis(connection_pool=get_redis_pool()))
+    bot = await get_bot()
+    # A single worker runs per deployment, so anything still marked as processing
+    # was interrupted by a previous shutdown.
+    requeued = await jobs.requeue_stale()
+    if requeued:
+        logger.info("Requeued %s interrupted upload jobs", requeued)
+    try:
+        while True:
+            job_id = await jobs.reserve(timeout=5)
+            UPLOAD_QUEUE_DEPTH.set(await jobs.depth())
+            if job_id is None:
+                continue
+            await handle(bot, job_id, jobs)
+            await jobs.ack(job_id)
+    finally:
+        await close_bot()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, stream=sys.stdout)
+    if settings.METRICS_PORT:
+        start_http_server(settings.METRICS_PORT)
+    asyncio.run(main())
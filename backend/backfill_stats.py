@@ -0,0 +1,58 @@
+import argparse
+import asyncio
+
+from sqlalchemy import func, cast, Date, delete, insert, select
+from sqlalchemy.ext.asyncio.session import AsyncSession
+
+from app.core.databases.postgres import get_session_without_depends
+from app.api.models import Option, User, UserAnswer, UserStatsDaily
+
+
+async def rebuild_user_stats(
+    session: AsyncSession, first_user_id: int, last_user_id: int
+) -> None:
+    """Recompute ``user_stats_daily`` for an inclusive range of user ids."""
+    users = UserAnswer.user_id.between(first_user_id, last_user_id)
+    day = cast(func.timezone("UTC", UserAnswer.created_at), Date)
+    rollup = (
+        select(
+            UserAnswer.user_id,
+            day,
+            func.count(),
+            func.count().filter(Option.is_correct.is_(True)),
+        )
+        .join(Option, Option.id == UserAnswer.option_id)
+        .where(users)
+        .group_by(UserAnswer.user_id, day)
+    )
+    await session.execute(
+        delete(UserStatsDaily).where(
+            UserStatsDaily.user_id.between(first_user_id, last_user_id)
+        )
+    )
+    await session.execute(
+        insert(UserStatsDaily).from_select(
+            ["user_id", "day", "answered", "correct"], rollup
+        )
+    )
+
+
+async def backfill(batch_size: int) -> None:
+    async with get_session_without_depends() as session:
+        last_id = (await session.execute(select(func.max(User.id)))).scalar() or 0
+        for first_user_id in range(1, last_id + 1, batch_size):
+            last_user_id = min(first_user_id + batch_size - 1, last_id)
+            await rebuild_user_stats(session, first_user_id, last_user_id)
+            await session.commit()
+            print(f"Rebuilt stats for users {first_user_id}..{last_user_id}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Rebuild the user_stats_daily rollup from user_answers."
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=1000, help="Users per transaction."
+    )
+    args = parser.parse_args()
+    asyncio.run(backfill(args.batch_size))
@@ -0,0 +1,126 @@
+import argparse
+import asyncio
+import time
+from datetime import datetime, UTC
+from types import SimpleNamespace
+from typing import Awaitable, Callable
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.api.controllers.question_controller.question_controller import (
+    QuestionController,
+)
+from app.api.schemas import QuestionListResponseSchema
+from app.api.utils.serialization import serialized
+
+# Stand-ins for ORM rows: schemas read them through from_attributes exactly
+# like Question/Option instances, without needing a database.
+
+
+def make_page(size: int, options_per_question: int) -> list[SimpleNamespace]:
+    now = datetime.now(UTC)
+    questions = []
+    for question_id in range(1, size + 1):
+        options = [
+            SimpleNamespace(
+                id=question_id * options_per_question + position,
+                question_id=question_id,
+                option=f"{chr(ord('A') + position)}) Option {position}",
+                is_correct=position == 0,
+                created_at=now,
+                updated_at=now,
+            )
+            for position in range(options_per_question)
+        ]
+        questions.append(
+            SimpleNamespace(
+                id=question_id,
+                name=f"Question {question_id}",
+                picture=f"https://example.com/{question_id}.png",
+                answer="A sentence long enough to look like a real answer.",
+                type="question",
+                level_id=1,
+                theme_id=2,
+                created_at=now,
+                updated_at=now,
+                options=options,
+            )
+        )
+    return questions
+
+
+def page_payload(questions: list[SimpleNamespace]) -> dict:
+    return dict(
+        page=1,
+        size=len(questions),
+        search=None,
+        filter=None,
+        sort=None,
+        total=len(questions),
+        next_cursor=None,
+        items=questions,
+    )
+
+
+async def measure(name: str, render: Callable[[], Awaitable[bytes]], rounds: int):
+    await render()  # warm up adapters and caches
+    started = time.perf_counter()
+    for _ in range(rounds):
+        await render()
+    elapsed = (time.perf_counter() - started) / rounds
+    print(f"{name:<40} {elapsed * 1000:8.3f} ms/page")
+    return elapsed
+
+
+async def main(args: argparse.Namespace) -> None:
+    questions = make_page(args.size, args.options_per_question)
+    field = create_model_field(
+        name="Response", type_=QuestionListResponseSchema, mode="serialization"
+    )
+
+    def build_models() -> QuestionListResponseSchema:
+        payload = page_payload(questions)
+        payload["items"] = [
+            QuestionController._response_to_question(question) for question in questions
+        ]
+        return QuestionListResponseSchema(**payload)
+
+    async def through_response_model(response_class) -> bytes:
+        # What FastAPI does with a model returned from an endpoint: dump it,
+        # validate it again against response_model, then encode it.
+        content = await serialize_response(field=field, response_content=build_models())
+        return response_class(content).body
+
+    async def json_response() -> bytes:
+        return await through_response_model(JSONResponse)
+
+    async def orjson_response() -> bytes:
+        return await through_response_model(ORJSONResponse)
+
+    async def fast_path() -> bytes:
+        return serialized(QuestionListResponseSchema, page_payload(questions)).body
+
+    print(
+        f"{args.size} questions x {args.options_per_question} options, "
+        f"{args.rounds} rounds"
+    )
+    baseline = await measure(
+        "models + response_model + JSONResponse", json_response, args.rounds
+    )
+    await measure(
+        "models + response_model + ORJSONResponse", orjson_response, args.rounds
+    )
+    fast = await measure("TypeAdapter fast path", fast_path, args.rounds)
+    print(f"speed-up over the baseline: {baseline / fast:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Time the serialization of one page of questions."
+    )
+    parser.add_argument("--size", type=int, default=100, help="Items per page.")
+    parser.add_argument("--options-per-question", type=int, default=4)
+    parser.add_argument("--rounds", type=int, default=200)
+    asyncio.run(main(parser.parse_args()))
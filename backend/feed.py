@@ -1,219 +1,337 @@
-import random
+import argparse
+import asyncio
 import json
-from sqlalchemy.ext.asyncio.session import AsyncSession
+import random
+import time
+from datetime import datetime, timedelta, UTC
+from typing import Callable, Iterator, Sequence
+
 from faker import Faker
-from typing import MutableSequence
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio.session import AsyncSession
 
 from app.core.databases.postgres import get_session_without_depends
-from app.api import models
-
-
-def get_random_int(start: int, stop: int):
-    return random.randint(start, stop)
+from backfill_stats import backfill
 
+# Faker is far too slow to call per row at these volumes, so each kind of text
+# is drawn from a pool generated once per run.
+POOL_SIZE = 1000
 
-def get_random_element(
-    elements: MutableSequence,
-):
-    random.shuffle(elements)
-    return random.choice(list(elements))
+# Timestamps are spread backwards from a fixed point rather than the wall
+# clock, so a seed yields the same rows on every run.
+DEFAULT_EPOCH = datetime(2025, 1, 1, tzinfo=UTC)
 
 
 class FeedService:
-    levels = set()
-    themes = set()
-    sections = set()
-    questions = set()
-    options = set()
-    questions_options = dict()
-    users = set()
-    user_answers = set()
-
-    async def feed_users(self):
-        seen = set()
-        for i in range(1, 10):
-            random_tg_id = self.faker.unique.random_int(min=100000000, max=999999999)
-            while random_tg_id in seen:
-                random_tg_id = self.faker.unique.random_int(
-                    min=100000000, max=999999999
-                )
-            user = models.User(
-                first_name=self.faker.first_name(),
-                last_name=self.faker.last_name(),
-                telegram_id=random_tg_id,
-                language="ru",
-                phone_number=self.faker.random_int(min=1000000000, max=9999999999),
-                is_admin=self.faker.boolean(chance_of_getting_true=1),
-                created_at=self.faker.date_time_between(
-                    start_date="-1y", end_date="now"
-                ),
-                updated_at=self.faker.date_time_between(
-                    start_date="-1y", end_date="now"
-                ),
-            )
-            self.session.add(user)
-            self.users.add(user)
-            seen.add(random_tg_id)
-        await self.session.commit()
+    """Bulk loader for development and benchmark data.
+
+    Rows are generated in batches and streamed with ``COPY``, so memory stays
+    flat whatever the cardinalities. Ids are assigned here, continuing after
+    the current maximum of each table, which lets answers reference questions
+    and options by arithmetic instead of keeping them in memory. The same
+    ``seed`` and ``epoch`` always produce the same data for the same arguments.
+    """
 
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, args: argparse.Namespace):
         self.session = session
-        self.faker: Faker = Faker()
+        self.args = args
+        self.random = random.Random(args.seed)
+        self.faker = Faker()
+        self.faker.seed_instance(args.seed)
+        self.now = args.epoch
+        self.first_names = [self.faker.first_name() for _ in range(POOL_SIZE)]
+        self.last_names = [self.faker.last_name() for _ in range(POOL_SIZE)]
+        self.sentences = [self.faker.sentence() for _ in range(POOL_SIZE)]
+        self.texts = [self.faker.text(max_nb_chars=255) for _ in range(POOL_SIZE)]
+        self.image_urls = [self.faker.image_url() for _ in range(POOL_SIZE)]
+        self.user_ids: range = range(0)
+        self.level_ids: range = range(0)
+        self.theme_ids: range = range(0)
+        self.question_ids: range = range(0)
+        self.first_option_id = 0
+
+    def pick(self, pool: Sequence):
+        return pool[self.random.randrange(len(pool))]
 
-    async def feed_level(
+    def timestamp(self, days: int) -> datetime:
+        return self.now - timedelta(seconds=self.random.randrange(days * 86400))
+
+    async def next_id(self, table: str) -> int:
+        result = await self.session.execute(
+            text(f"SELECT COALESCE(MAX(id), 0) + 1 FROM {table}")
+        )
+        return result.scalar_one()
+
+    async def copy(
         self,
-    ):
-        for l, th, s in zip(range(1, 5), range(1, 5), range(1, 5)):
-            level = models.Level(
-                name=f"Level {l}",
-                description=self.faker.text(max_nb_chars=255),
-                picture=self.faker.image_url(),
-                type="level",
-                created_at=self.faker.date_time_between(
-                    start_date="-1y", end_date="now"
-                ),
-                updated_at=self.faker.date_time_between(
-                    start_date="-1y", end_date="now"
-                ),
+        table: str,
+        columns: tuple[str, ...],
+        count: int,
+        make_row: Callable[[int], tuple],
+        first_id: int,
+    ) -> range:
+        """COPY ``count`` rows built by ``make_row(id)`` into ``table``."""
+        ids = range(first_id, first_id + count)
+        connection = await self.session.connection()
+        raw = await connection.get_raw_connection()
+        started = time.perf_counter()
+        for batch in self.batches(ids, make_row):
+            await raw.driver_connection.copy_records_to_table(
+                table, records=batch, columns=("id", *columns)
             )
-            theme = models.Level(
-                name=f"Theme {th}",
-                description=self.faker.text(max_nb_chars=255),
-                picture=self.faker.image_url(),
-                type="theme",
-                created_at=self.faker.date_time_between(
-                    start_date="-1y", end_date="now"
+        if count:
+            await self.session.execute(
+                text(
+                    f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), :last_id)"
                 ),
-                updated_at=self.faker.date_time_between(
-                    start_date="-1y", end_date="now"
-                ),
-            )
-            section = models.Level(
-                name=f"Section {s}",
-                description=self.faker.text(max_nb_chars=255),
-                picture=self.faker.image_url(),
-                type="section",
+                {"last_id": ids[-1]},
             )
-            self.session.add(theme)
-            self.session.add(section)
-            self.session.add(level)
-            self.levels.add(level)
-            self.themes.add(theme)
-            self.sections.add(section)
         await self.session.commit()
+        elapsed = time.perf_counter() - started
+        print(f"{table}: {count} rows in {elapsed:.1f}s")
+        return ids
 
-    async def feed_questions(self):
-        pp = ["question"] * 9
-        pp.append("daily")
-        for i in range(1, 10001):
-            question = models.Question(
-                name=f"Question {i}",
-                picture=self.faker.image_url(),
-                answer=self.faker.sentence(),
-                type=get_random_element(pp),
-                level=get_random_element(list(self.levels)),
-                theme=get_random_element(list(self.themes)),
-                created_at=self.faker.date_time_between(
-                    start_date="-1y", end_date="now"
-                ),
-                updated_at=self.faker.date_time_between(
-                    start_date="-1y", end_date="now"
-                ),
+    def batches(
+        self, ids: range, make_row: Callable[[int], tuple]
+    ) -> Iterator[list[tuple]]:
+        size = self.args.batch_size
+        for start in range(0, len(ids), size):
+            yield [(id_, *make_row(id_)) for id_ in ids[start : start + size]]
+
+    async def feed_users(self) -> None:
+        def make_row(id_: int) -> tuple:
+            created_at = self.timestamp(365)
+            return (
+                self.pick(self.first_names),
+                self.pick(self.last_names),
+                # Offsetting the id keeps telegram_id unique without a lookup.
+                100_000_000 + id_,
+                "ru",
+                self.random.randint(1_000_000_000, 9_999_999_999),
+                self.random.random() < 0.01,
+                created_at,
+                created_at,
             )
-            self.session.add(question)
-            self.questions.add(question)
-        await self.session.commit()
 
-    async def feed_options(self):
-        for question in self.questions:
-            a = []
-            for i in range(4):
-                option = models.Option(
-                    question_id=question.id,
-                    option=self.faker.sentence(nb_words=20),
-                    is_correct=(False if i != 0 else True),
-                    created_at=self.faker.date_time_between(
-                        start_date="-1y", end_date="now"
-                    ),
-                    updated_at=self.faker.date_time_between(
-                        start_date="-1y", end_date="now"
-                    ),
+        self.user_ids = await self.copy(
+            "users",
+            (
+                "first_name",
+                "last_name",
+                "telegram_id",
+                "language",
+                "phone_number",
+                "is_admin",
+                "created_at",
+                "updated_at",
+            ),
+            self.args.users,
+            make_row,
+            await self.next_id("users"),
+        )
+
+    async def feed_levels(self) -> None:
+        columns = ("name", "description", "picture", "type", "created_at", "updated_at")
+        for type_, title in (
+            ("level", "Level"),
+            ("theme", "Theme"),
+            ("section", "Section"),
+        ):
+
+            def make_row(id_: int) -> tuple:
+                created_at = self.timestamp(365)
+                return (
+                    f"{title} {id_}",
+                    self.pick(self.texts),
+                    self.pick(self.image_urls),
+                    type_,
+                    created_at,
+                    created_at,
                 )
-                self.session.add(option)
-                self.options.add(option)
-                a.append(option)
-            self.questions_options[question.id] = a.copy()
-            a.clear()
-        await self.session.commit()
 
-    async def feed_user_answers(self):
-        for i in range(1, 10001):
-            user = get_random_element(list(self.users))
-            question = get_random_element(list(self.questions))
-            option = get_random_element(self.questions_options[question.id])
-            user_answer = models.UserAnswer(
-                user_id=user.id,
-                question_id=question.id,
-                option_id=option.id,
-                created_at=self.faker.date_time_between(
-                    start_date="-3y", end_date="now"
-                ),
-                updated_at=self.faker.date_time_between(
-                    start_date="-3y", end_date="now"
-                ),
+            ids = await self.copy(
+                "levels",
+                columns,
+                self.args.levels,
+                make_row,
+                await self.next_id("levels"),
             )
-            self.session.add(user_answer)
-            self.user_answers.add(user_answer)
-        await self.session.commit()
+            if type_ == "level":
+                self.level_ids = ids
+            elif type_ == "theme":
+                self.theme_ids = ids
+
+    async def feed_questions(self) -> None:
+        def make_row(id_: int) -> tuple:
+            created_at = self.timestamp(365)
+            return (
+                f"Question {id_}",
+                self.pick(self.image_urls),
+                self.pick(self.sentences),
+                "daily" if self.random.random() < 0.1 else "question",
+                self.pick(self.level_ids),
+                self.pick(self.theme_ids),
+                created_at,
+                created_at,
+            )
+
+        self.question_ids = await self.copy(
+            "questions",
+            (
+                "name",
+                "picture",
+                "answer",
+                "type",
+                "level_id",
+                "theme_id",
+                "created_at",
+                "updated_at",
+            ),
+            self.args.questions,
+            make_row,
+            await self.next_id("questions"),
+        )
+
+    async def feed_options(self) -> None:
+        # Options are laid out question by question, the first one correct:
+        # the options of the i-th question are first_option_id + i * k + [0, k).
+        per_question = self.args.options_per_question
+        self.first_option_id = await self.next_id("options")
+
+        def make_row(id_: int) -> tuple:
+            index, position = divmod(id_ - self.first_option_id, per_question)
+            created_at = self.timestamp(365)
+            return (
+                self.question_ids[index],
+                # The prefix keeps (question_id, option) unique.
+                f"{chr(ord('A') + position)}) {self.pick(self.sentences)}",
+                position == 0,
+                created_at,
+                created_at,
+            )
+
+        await self.copy(
+            "options",
+            ("question_id", "option", "is_correct", "created_at", "updated_at"),
+            len(self.question_ids) * per_question,
+            make_row,
+            self.first_option_id,
+        )
+
+    async def feed_user_answers(self) -> None:
+        per_question = self.args.options_per_question
+
+        def make_row(_: int) -> tuple:
+            index = self.random.randrange(len(self.question_ids))
+            option_id = (
+                self.first_option_id
+                + index * per_question
+                + self.random.randrange(per_question)
+            )
+            created_at = self.timestamp(3 * 365)
+            return (
+                self.pick(self.user_ids),
+                self.question_ids[index],
+                option_id,
+                created_at,
+                created_at,
+            )
+
+        await self.copy(
+            "user_answers",
+            ("user_id", "question_id", "option_id", "created_at", "updated_at"),
+            self.args.answers,
+            make_row,
+            await self.next_id("user_answers"),
+        )
+
+    async def feed_settings(self) -> None:
+        first_setting_id = await self.next_id("setting")
+        # One settings row per seeded user, in the same order.
+        user_offset = self.user_ids.start - first_setting_id
+
+        def flag() -> bool:
+            return self.random.random() < 0.5
 
-    async def feed_setting(self):
-        for user in self.users:
+        def make_row(id_: int) -> tuple:
             settings_data = {
-                "theme": (
-                    "dark" if self.faker.boolean(chance_of_getting_true=50) else "light"
-                ),
-                "notifications_sound": self.faker.boolean(chance_of_getting_true=50),
-                "notifications_vibration": self.faker.boolean(
-                    chance_of_getting_true=50
-                ),
-                "notifications_push": self.faker.boolean(chance_of_getting_true=50),
-                "notifications_email": self.faker.boolean(chance_of_getting_true=50),
-                "notifications_sms": self.faker.boolean(chance_of_getting_true=50),
-                "notifications_in_app": self.faker.boolean(chance_of_getting_true=50),
-                "notifications_push_daily_question": self.faker.boolean(
-                    chance_of_getting_true=50
-                ),
-                "language": user.language,
+                "theme": "dark" if flag() else "light",
+                "notifications_sound": flag(),
+                "notifications_vibration": flag(),
+                "notifications_push": flag(),
+                "notifications_email": flag(),
+                "notifications_sms": flag(),
+                "notifications_in_app": flag(),
+                "notifications_push_daily_question": flag(),
+                "language": "ru",
                 "notifications": {
-                    "daily_question": self.faker.boolean(chance_of_getting_true=50),
-                    "weekly_summary": self.faker.boolean(chance_of_getting_true=50),
-                    "monthly_summary": self.faker.boolean(chance_of_getting_true=50),
+                    "daily_question": flag(),
+                    "weekly_summary": flag(),
+                    "monthly_summary": flag(),
                 },
             }
-            json_str = json.dumps(settings_data)
-            safe_settings = json.loads(json_str)
-            setting = models.Setting(
-                user_id=user.id,
-                settings=safe_settings,
-            )
-            self.session.add(setting)
+            return id_ + user_offset, json.dumps(settings_data)
+
+        await self.copy(
+            "setting",
+            ("user_id", "settings"),
+            len(self.user_ids),
+            make_row,
+            first_setting_id,
+        )
 
-        await self.session.commit()
 
+def parse_epoch(value: str) -> datetime:
+    epoch = datetime.fromisoformat(value)
+    return epoch if epoch.tzinfo else epoch.replace(tzinfo=UTC)
 
-async def main():
+
+async def main(args: argparse.Namespace) -> None:
     async with get_session_without_depends() as session:
-        feed_service = FeedService(session)
+        feed_service = FeedService(session, args)
         await feed_service.feed_users()
-        await feed_service.feed_level()
+        await feed_service.feed_levels()
         await feed_service.feed_questions()
         await feed_service.feed_options()
-
         await feed_service.feed_user_answers()
-        await feed_service.feed_setting()
+        await feed_service.feed_settings()
+    # user_answers were written around the repository, so the daily rollup has
+    # to be rebuilt from them.
+    await backfill(args.stats_batch_size)
 
 
 if __name__ == "__main__":
-    import asyncio
-
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(
+        description="Seed the database with reproducible fake data."
+    )
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument(
+        "--levels", type=int, default=4, help="Levels, themes and sections each."
+    )
+    parser.add_argument("--questions", type=int, default=10_000)
+    parser.add_argument("--options-per-question", type=int, default=4)
+    parser.add_argument("--answers", type=int, default=10_000)
+    parser.add_argument(
+        "--batch-size", type=int, default=10_000, help="Rows per COPY batch."
+    )
+    parser.add_argument(
+        "--stats-batch-size",
+        type=int,
+        default=1000,
+        help="Users per transaction when rebuilding user_stats_daily.",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--epoch",
+        type=parse_epoch,
+        default=DEFAULT_EPOCH,
+        help="ISO datetime the generated timestamps lead up to (UTC if naive).",
+    )
+    args = parser.parse_args()
+    if args.answers and not (args.users and args.questions):
+        parser.error("--answers needs at least one user and one question.")
+    if not 1 <= args.options_per_question <= 26:
+        parser.error("--options-per-question must be between 1 and 26.")
+    if args.questions and not args.levels:
+        parser.error("--questions needs at least one level and theme.")
+    asyncio.run(main(args))
@@ -0,0 +1,52 @@
+import os
+
+# Settings has required fields with no defaults; the tests never reach these
+# services, so placeholders are enough.
+for name, value in {
+    "BASE_URL": "http://testserver",
+    "BOT_TOKEN": "0:test",
+    "TG_CHANNEL_ID": "0",
+    "TELEGRAM_STATE_DB": "1",
+    "POSTGRES_USER": "test",
+    "POSTGRES_PASSWORD": "test",
+    "POSTGRES_HOST": "localhost",
+    "POSTGRES_PORT": "5432",
+    "POSTGRES_DB": "test",
+    "REDIS_HOST": "localhost",
+    "REDIS_PORT": "6379",
+    "REDIS_PASSWORD": "",
+    "SECRET_KEY": "test",
+    "ALGORITHM": "HS256",
+    "ACCESS_TOKEN_EXPIRE_MINUTES": "5",
+    "REFRESH_TOKEN_EXPIRE_DAYS": "1",
+    "OPENAI_API_KEY": "test",
+}.items():
+    os.environ.setdefault(name, value)
+
+import pytest_asyncio  # noqa: E402
+from sqlalchemy.ext.asyncio import (  # noqa: E402
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app.api.models import Level, Option, Question  # noqa: E402
+from app.core.databases.instrumentation import instrument  # noqa: E402
+from app.core.models.base import Base  # noqa: E402
+
+
+@pytest_asyncio.fixture
+async def session() -> AsyncSession:
+    """A session on an in-memory SQLite database holding the question tables.
+
+    The engine is instrumented like the application's, so statements run
+    through it are recorded by ``start_query_stats``.
+    """
+    engine = create_async_engine("sqlite+aiosqlite://")
+    instrument(engine.sync_engine)
+    tables = [model.__table__ for model in (Level, Question, Option)]
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all, tables=tables)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
@@ -0,0 +1,108 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.api.controllers import QuestionController
+from app.api.models import Level, Option, Question
+from app.api.repositories import QuestionRepository
+from app.api.schemas import QuestionQueryParamSchema
+from app.core.databases.instrumentation import RepeatedQueryError, start_query_stats
+
+# Strict mode with a limit of 1: any statement shape running twice in one
+# call, the signature of a per-question loop, raises RepeatedQueryError.
+REPEAT_LIMIT = 1
+
+
+class FakeLevelCatalog:
+    def __init__(self, levels: dict[int, str]) -> None:
+        self.levels = levels
+
+    async def get(self, level_id: int) -> SimpleNamespace | None:
+        if level_id not in self.levels:
+            return None
+        return SimpleNamespace(id=level_id, type=self.levels[level_id])
+
+
+class FakeQuestionPool:
+    """Stands in for the Redis id pools; ``ids=None`` is a pool miss."""
+
+    def __init__(self, ids: list[int] | None) -> None:
+        self.ids = ids
+
+    async def sample(self, level_id: int, theme_id: int, limit: int):
+        return None if self.ids is None else self.ids[:limit]
+
+
+async def seed(session, questions: int, options: int = 4) -> tuple[int, int]:
+    level = Level(name="Level", type="level")
+    theme = Level(name="Theme", type="theme")
+    session.add_all([level, theme])
+    await session.flush()
+    for number in range(questions):
+        question = Question(
+            name=f"Question {number}", level_id=level.id, theme_id=theme.id
+        )
+        question.options = [
+            Option(option=f"Option {position}", is_correct=position == 0)
+            for position in range(options)
+        ]
+        session.add(question)
+    await session.commit()
+    return level.id, theme.id
+
+
+def controller(session, level_id: int, theme_id: int, pool_ids=None):
+    return QuestionController(
+        QuestionRepository(session),
+        FakeQuestionPool(pool_ids),
+        FakeLevelCatalog({level_id: "level", theme_id: "theme"}),
+    )
+
+
+async def count_list(session, size: int) -> int:
+    level_id, theme_id = await seed(session, size)
+    query = QuestionQueryParamSchema(size=size, level_id=level_id)
+    stats = start_query_stats(REPEAT_LIMIT)
+    await controller(session, level_id, theme_id).list_(query)
+    return stats.count
+
+
+async def count_random(session, size: int, from_pool: bool) -> int:
+    level_id, theme_id = await seed(session, size)
+    pool_ids = list(range(1, size + 1)) if from_pool else None
+    session.expunge_all()
+    stats = start_query_stats(REPEAT_LIMIT)
+    questions = await controller(session, level_id, theme_id, pool_ids).random(
+        level_id, theme_id, size
+    )
+    assert len(questions) == size
+    assert all(len(question.variants) == 4 for question in questions)
+    return stats.count
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", [1, 20])
+async def test_question_list_runs_constant_queries(session, size):
+    # The page and its options: one windowed select, one selectin load.
+    assert await count_list(session, size) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", [1, 20])
+@pytest.mark.parametrize("from_pool", [True, False])
+async def test_random_quiz_runs_constant_queries(session, size, from_pool):
+    assert await count_random(session, size, from_pool) == 2
+
+
+@pytest.mark.asyncio
+async def test_strict_mode_rejects_repeated_statements(session):
+    await seed(session, 2)
+    repository = QuestionRepository(session)
+    start_query_stats(REPEAT_LIMIT)
+    await repository.get(1)
+    with pytest.raises(RepeatedQueryError):
+        # A per-question loop: the second lookup repeats the first shape.
+        await repository.get(2)
+    # The rejected statement must not leave a start time on the connection.
+    connection = await session.connection()
+    assert not connection.info.get("query_started")